@@ -1,6 +1,35 @@
 """Base API for PyWebView communication."""
 
-from datetime import datetime
+import threading
+import time
+from collections import deque
+
+import orjson
+
+# Installed into every page so notifications only ship a JSON string, not fresh source
+DISPATCHER_JS = """
+window.__apiDispatch = function (event, payload) {
+    const handler = "on" + event.charAt(0).toUpperCase() + event.slice(1);
+    if (window.dashboard && window.dashboard[handler]) {
+        window.dashboard[handler](payload === null ? null : JSON.parse(payload));
+    }
+};
+"""
+
+# Maximum number of notifications held while the page has no dispatcher yet
+PENDING_NOTIFICATION_LIMIT = 100
+
+# (epoch second, formatted time) of the last console_log timestamp
+_timestamp_cache = (0, "")
+
+
+def _timestamp() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _timestamp_cache[1]
 
 
 class BaseApi:
@@ -14,7 +43,12 @@ class BaseApi:
         """
         # Store window in a way that won't be serialized by pywebview
         # Using double underscore to make it name-mangled and harder to serialize
-        self.__window = window
+        self.__window = None
+        self._evaluate_js = None
+        # Dispatch calls that arrived before the page defined window.__apiDispatch
+        self._pending_notifications: deque[str] = deque(maxlen=PENDING_NOTIFICATION_LIMIT)
+        self._notify_lock = threading.Lock()
+        self.window = window
 
     @property
     def window(self):
@@ -24,13 +58,48 @@ class BaseApi:
     @window.setter
     def window(self, value):
         """Set window reference safely."""
+        old = self.__window
         self.__window = value
+        # Cached so notify_frontend skips the property lookup on every call
+        self._evaluate_js = value.evaluate_js if value is not None else None
+        if value is old:
+            return
+        if old is not None:
+            old.events.loaded -= self._install_dispatcher
+        if value is not None:
+            # Page navigation drops the dispatcher, so reinstall it on every load
+            value.events.loaded += self._install_dispatcher
+
+    def _install_dispatcher(self):
+        """Define the JavaScript notification dispatcher and deliver queued notifications."""
+        with self._notify_lock:
+            try:
+                self._evaluate_js(DISPATCHER_JS)
+                self._flush_notifications(self._evaluate_js)
+            except Exception as e:
+                print(f"Error installing frontend dispatcher: {e}")
+
+    def _flush_notifications(self, evaluate_js):
+        """Deliver queued notifications in order, stopping if the page has no dispatcher.
+
+        Must be called with the notify lock held.
+
+        Args:
+            evaluate_js: Window evaluate_js function to deliver through
+        """
+        pending = self._pending_notifications
+        while pending:
+            if not evaluate_js(f"window.__apiDispatch ? (window.__apiDispatch({pending[0]}), true) : false"):
+                break
+            pending.popleft()
 
     def __getstate__(self):
         """Custom serialization to exclude window from being serialized."""
         state = self.__dict__.copy()
         # Remove window from state to prevent serialization issues
         state.pop("_BaseApi__window", None)
+        state.pop("_evaluate_js", None)
+        state.pop("_notify_lock", None)
         for key in list(state.keys()):
             if "window" in key.lower() and key.startswith("_"):
                 state.pop(key, None)
@@ -40,6 +109,8 @@ class BaseApi:
         """Custom deserialization."""
         self.__dict__.update(state)
         self.__window = None
+        self._evaluate_js = None
+        self._notify_lock = threading.Lock()
 
     def __dir__(self):
         """Override dir() to hide window from introspection."""
@@ -58,27 +129,28 @@ class BaseApi:
             level: Log level (info, warn, error, debug)
             message: Log message
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] JS-{level.upper()}: {message}")
+        print(f"[{_timestamp()}] JS-{level.upper()}: {message}")
 
     def notify_frontend(self, event: str, data: dict | None = None):
         """Send notification to frontend JavaScript.
 
+        Notifications sent before the window exists or before the page has
+        loaded the dispatcher are queued and delivered once it is installed.
+
         Args:
             event: Event name
             data: Optional data to send with the event
         """
-        if not self.window:
-            return
-
         try:
-            data_json = "null" if data is None else str(data)
-            js_code = f"""
-                if (window.dashboard && window.dashboard.on{event.capitalize()}) {{
-                    window.dashboard.on{event.capitalize()}({data_json});
-                }}
-            """
-            self.window.evaluate_js(js_code)
+            # Pass the payload as a JSON string literal for JSON.parse in the dispatcher
+            payload = "null" if data is None else orjson.dumps(orjson.dumps(data).decode()).decode()
+            args = f"{orjson.dumps(event).decode()}, {payload}"
+
+            with self._notify_lock:
+                # Queue first so earlier undelivered notifications keep their order
+                self._pending_notifications.append(args)
+                if self._evaluate_js is not None:
+                    self._flush_notifications(self._evaluate_js)
         except Exception as e:
             print(f"Error notifying frontend: {e}")
 
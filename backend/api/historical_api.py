@@ -1,20 +1,137 @@
 """Historical API for PyWebView communication."""
 
-import json
+import functools
 import os
+import queue
 import threading
+import time
+from dataclasses import replace
+from pathlib import Path
 from typing import Any
 
-import pandas as pd
+import orjson
 
 from backend.utils.logger import get_logger
-
-from ..repositories.historical_repository import HistoricalRepository
+from config import cyclone_seasons
+
+from ..models.analysis_status import AnalysisStatus
+from ..repositories.historical_repository import (
+    HISTORICAL_OUTPUT_DIR,
+    HistoricalRepository,
+    fishing_grounds_geojson_path,
+)
 from ..utils.utils import get_database_path
 from .base_api import BaseApi
 
 logger = get_logger(__name__)
 
+# Columns of df_all_b_{country}_{year}.csv needed to plot boat detections
+BOAT_DETECTION_COLUMNS = ["Lon_DNB", "Lat_DNB", "date_only"]
+
+# pywebview serves frontend/static (the directory of the first page loaded) over its local http
+# server, so files written here can be fetch()ed by the dashboard at BOAT_DETECTIONS_URL_PATH
+STATIC_DIR = Path(__file__).resolve().parents[2] / "frontend" / "static"
+BOAT_DETECTIONS_SERVE_DIR = STATIC_DIR / "historical" / "data" / "boat_detections"
+BOAT_DETECTIONS_URL_PATH = "/historical/data/boat_detections"
+
+# Minimum interval between status pushes to the frontend (seconds)
+STATUS_PUSH_INTERVAL = 0.05
+
+# Strips hyphens from typhoon names when building dashboard keys
+_NAME_NORM_TABLE = str.maketrans("", "", "-")
+
+
+def _norm_name(name: str) -> str:
+    """Normalize a typhoon name to its dashboard key (lowercase, no hyphens)."""
+    return name.translate(_NAME_NORM_TABLE).lower()
+
+
+def _feature_collection(lon, lat, dates) -> dict[str, Any]:
+    """Build a GeoJSON FeatureCollection of boat detection points.
+
+    Coordinates are rounded to 5 decimals (~1 m), plenty for plotting sampled
+    detections. Points with a non-finite coordinate are skipped, since JSON has
+    no NaN or infinity.
+    """
+    # Imported here so app startup does not pay for numpy
+    import numpy as np
+
+    lon = np.asarray(lon, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    dates = np.asarray(dates, dtype=object)
+    finite = np.isfinite(lon) & np.isfinite(lat)
+    if not finite.all():
+        lon, lat, dates = lon[finite], lat[finite], dates[finite]
+
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [x, y]},
+                "properties": {"date": None if d is None else str(d)},
+            }
+            for x, y, d in zip(lon.round(5).tolist(), lat.round(5).tolist(), dates.tolist(), strict=True)
+        ],
+    }
+
+
+def _read_boat_detections(csv_path: Path, sample_size: int):
+    """Read (optionally sampled) boat detection columns from a CSV file.
+
+    Returns:
+        Tuple of (lon, lat, dates) arrays
+    """
+    # Imported here so app startup does not pay for numpy and pandas
+    import numpy as np
+    import pandas as pd
+
+    # Load only the columns needed for plotting
+    logger.info(f"Loading boat detections from {csv_path}")
+    df = pd.read_csv(csv_path, usecols=BOAT_DETECTION_COLUMNS)
+
+    # Sample data if too large; sorted row positions keep the take sequential
+    if len(df) > sample_size:
+        logger.info(f"Sampling {sample_size} points from {len(df)} total boat detections")
+        idx = np.random.default_rng(42).choice(len(df), sample_size, replace=False)
+        df = df.take(np.sort(idx))
+
+    # Pull the raw column arrays (avoids a Series allocation per row)
+    lon = df["Lon_DNB"].to_numpy(dtype=float)
+    lat = df["Lat_DNB"].to_numpy(dtype=float)
+    dates = df["date_only"].astype(object).where(df["date_only"].notna(), None).to_numpy()
+    return lon, lat, dates
+
+
+@functools.lru_cache(maxsize=8)
+def _boat_geojson(csv_path: Path, sample_size: int, mtime: float) -> dict[str, Any]:
+    """Boat detection FeatureCollection, cached per CSV modification time. Treat the result as read-only."""
+    return _feature_collection(*_read_boat_detections(csv_path, sample_size))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a file, replacing it atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+@functools.cache
+def _historical_pipeline():
+    """Import the processing pipeline on first use; it pulls in geopandas and matplotlib."""
+    from backend.services.historical import Config, main
+
+    return Config, main
+
+
+@functools.cache
+def _historical_db_update():
+    """Import the database updater on first use; it pulls in pandas."""
+    from backend.services.historical_db_update import update_historical_database_from_run
+
+    return update_historical_database_from_run
+
 
 class HistoricalApi(BaseApi):
     """API class for historical typhoon dashboard communication."""
@@ -29,19 +146,26 @@ class HistoricalApi(BaseApi):
         db_path = get_database_path("database/historical.json")
         self.repository = HistoricalRepository(db_path=db_path)
 
+        # Boat detection GeoJSON files already served: path -> (csv mtime_ns, sample size)
+        self._served_boat_files: dict[Path, tuple[int, int]] = {}
+
         # Status tracking for historical analysis processing
+        # Writers swap the snapshot under the lock; readers just load the attribute
         self._status_lock = threading.Lock()
-        self._analysis_status = {
-            "status": "idle",  # idle, running, completed, error, cancelled
-            "current_phase": 0,
-            "total_phases": 5,
-            "phase_name": "",
-            "message": "",
-            "progress_percent": 0,
-            "error_message": None,
-        }
-        self._processing_thread = None
-        self._cancellation_flag = threading.Event()
+        self._analysis_status = AnalysisStatus()
+        # Cancel token of the job that is queued or running, None when the worker is idle
+        self._active_job: threading.Event | None = None
+
+        # Analysis runs on a single pre-started worker fed through a queue
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # Status changes are coalesced and pushed to the frontend by a single thread
+        self._closed = False
+        self._status_dirty = threading.Event()
+        self._status_pusher = threading.Thread(target=self._push_status_loop, daemon=True)
+        self._status_pusher.start()
 
         logger.info(f"Historical API initialized with database path: {db_path} and repository: {self.repository}")
 
@@ -108,16 +232,10 @@ class HistoricalApi(BaseApi):
             Dictionary with typhoons and fishing grounds
         """
         try:
-            # Get typhoons in dashboard format
+            # Get typhoons in dashboard format; historical fishing grounds are per-typhoon,
+            # so there is no separate list to merge in
             dashboard_data = self.repository.get_dashboard_data()
 
-            # Get fishing grounds (empty list as they're created per run)
-            fishing_grounds = self.get_fishing_grounds()
-
-            # Update fishing grounds if we have them
-            if fishing_grounds:
-                dashboard_data["fishing_grounds"] = fishing_grounds
-
             logger.info("Historical dashboard data prepared successfully")
             return dashboard_data
 
@@ -143,6 +261,39 @@ class HistoricalApi(BaseApi):
             logger.error(f"Error getting fishing grounds: {e}")
             return []
 
+    def _boat_csv_path(self, year: int) -> Path | None:
+        """Get the boat detections CSV for a year.
+
+        Args:
+            year: Year to load data for
+
+        Returns:
+            Path to the CSV or None if file not found
+        """
+        boat_csv_path = HISTORICAL_OUTPUT_DIR / str(year) / "intermediate" / f"df_all_b_phl_{year}.csv"
+
+        if not os.path.exists(boat_csv_path):
+            logger.warning(f"Boat detections file not found: {boat_csv_path}")
+            return None
+        return boat_csv_path
+
+    def _load_boat_geojson(self, year: int, sample_size: int) -> dict[str, Any] | None:
+        """Get the boat detection FeatureCollection for a year.
+
+        Args:
+            year: Year to load data for
+            sample_size: Number of random points to sample
+
+        Returns:
+            GeoJSON FeatureCollection or None if file not found
+        """
+        boat_csv_path = self._boat_csv_path(year)
+        if boat_csv_path is None:
+            return None
+
+        # Keyed on mtime so a new analysis run invalidates the cached payload
+        return _boat_geojson(boat_csv_path, sample_size, os.path.getmtime(boat_csv_path))
+
     def get_boat_detections_geojson(self, year: int, sample_size: int = 5000) -> dict[str, Any] | None:
         """Load boat detection points and convert to GeoJSON.
 
@@ -154,47 +305,12 @@ class HistoricalApi(BaseApi):
             GeoJSON FeatureCollection or None if file not found
         """
         try:
-            # Build path to boat detections CSV
-            boat_csv_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "data",
-                "outputs",
-                "historical",
-                "phl",
-                str(year),
-                "intermediate",
-                f"df_all_b_phl_{year}.csv",
-            )
-
-            if not os.path.exists(boat_csv_path):
-                logger.warning(f"Boat detections file not found: {boat_csv_path}")
+            # Built once per CSV version; repeat calls return the cached collection
+            geojson = self._load_boat_geojson(year, sample_size)
+            if geojson is None:
                 return None
 
-            # Load CSV
-            logger.info(f"Loading boat detections from {boat_csv_path}")
-            df = pd.read_csv(boat_csv_path)
-
-            # Sample data if too large
-            if len(df) > sample_size:
-                logger.info(f"Sampling {sample_size} points from {len(df)} total boat detections")
-                df = df.sample(n=sample_size, random_state=42)
-
-            # Convert to GeoJSON
-            features = []
-            for _, row in df.iterrows():
-                feature = {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [row["Lon_DNB"], row["Lat_DNB"]],
-                    },
-                    "properties": {"date": str(row["date_only"]) if pd.notna(row["date_only"]) else None},
-                }
-                features.append(feature)
-
-            geojson = {"type": "FeatureCollection", "features": features}
-
-            logger.info(f"Converted {len(features)} boat detections to GeoJSON")
+            logger.info(f"Converted {len(geojson['features'])} boat detections to GeoJSON")
             return geojson
 
         except Exception as e:
@@ -204,6 +320,42 @@ class HistoricalApi(BaseApi):
             traceback.print_exc()
             return None
 
+    def get_boat_detections_url(self, year: int, sample_size: int = 5000) -> dict[str, Any] | None:
+        """Write boat detection points to a GeoJSON file under the http root and return its URL.
+
+        The frontend fetches the file from pywebview's local http server, so the
+        FeatureCollection never crosses the JS bridge. The file is only rewritten
+        when the source CSV or sample size changes.
+
+        Args:
+            year: Year to load data for
+            sample_size: Number of random points to sample (default 5000 for performance)
+
+        Returns:
+            Dictionary with 'url' and 'count' or None if file not found
+        """
+        try:
+            boat_csv_path = self._boat_csv_path(year)
+            if boat_csv_path is None:
+                return None
+
+            geojson = self._load_boat_geojson(year, sample_size)
+            output_path = BOAT_DETECTIONS_SERVE_DIR / f"boat_detections_{year}.geojson"
+            source = (os.stat(boat_csv_path).st_mtime_ns, sample_size)
+
+            if self._served_boat_files.get(output_path) != source or not output_path.exists():
+                _write_atomic(output_path, orjson.dumps(geojson))
+                self._served_boat_files[output_path] = source
+                logger.info(f"Wrote {len(geojson['features'])} boat detections to {output_path}")
+
+            # The version query keeps the webview from reusing a cached copy of an older file
+            url = f"{BOAT_DETECTIONS_URL_PATH}/{output_path.name}?v={source[0]}-{sample_size}"
+            return {"url": url, "count": len(geojson["features"])}
+
+        except Exception as e:
+            logger.error(f"Error writing boat detections for year {year}: {e}", exc_info=True)
+            return None
+
     def get_available_years(self) -> list[int]:
         """Get all available years from the database.
 
@@ -233,7 +385,7 @@ class HistoricalApi(BaseApi):
 
             for typhoon in typhoons:
                 # Use name as key (normalized)
-                key = typhoon["name"].lower().replace("-", "")
+                key = _norm_name(typhoon["name"])
                 dashboard_typhoons[key] = typhoon.get("dashboard_data", {})
 
             logger.info(f"Retrieved {len(dashboard_typhoons)} typhoons for year {year}")
@@ -242,63 +394,78 @@ class HistoricalApi(BaseApi):
             logger.error(f"Error getting typhoons for year {year}: {e}")
             return {}
 
-    def get_dashboard_data_by_year(self, year: int) -> dict[str, Any]:
+    def _load_fishing_grounds_geojson(self, year: int) -> dict[str, Any] | None:
+        """Load the merged fishing grounds GeoJSON for a year.
+
+        Args:
+            year: Year to load data for
+
+        Returns:
+            GeoJSON FeatureCollection or None if unavailable
+        """
+        try:
+            fishing_grounds_geojson = self.repository.get_fishing_grounds_geojson(year)
+            if fishing_grounds_geojson is None:
+                return None
+            logger.info(f"Loaded fishing grounds GeoJSON for year {year}")
+            return fishing_grounds_geojson
+        except Exception as e:
+            logger.error(f"Error loading fishing grounds GeoJSON for year {year}: {e}")
+            return None
+
+    def _dashboard_etag(self, year: int) -> str:
+        """Build a version tag for a year's dashboard data from its source files.
+
+        The tag is a string because ns mtimes exceed 2**53 and would lose precision
+        as JavaScript numbers on the round trip through the frontend.
+
+        Args:
+            year: Year to tag
+
+        Returns:
+            "year:db_mtime:geojson_mtime:csv_mtime" with mtimes in ns (0 if missing)
+        """
+        paths = (
+            self.repository.db_path,
+            fishing_grounds_geojson_path(year),
+            self._boat_csv_path(year),
+        )
+        parts = [str(year)]
+        for path in paths:
+            try:
+                parts.append(str(os.stat(path).st_mtime_ns if path is not None else 0))
+            except FileNotFoundError:
+                parts.append("0")
+        return ":".join(parts)
+
+    def get_dashboard_data_by_year(self, year: int, client_etag: str | None = None) -> dict[str, Any]:
         """Get dashboard data filtered by year.
 
         Args:
             year: Year to filter by
+            client_etag: Etag from the caller's last response for this year, if any
 
         Returns:
-            Dictionary with typhoons and fishing grounds for the year
+            Dictionary with typhoons and fishing grounds for the year and its etag,
+            or {"unchanged": True, "etag": ...} if client_etag is still current
         """
         try:
+            etag = self._dashboard_etag(year)
+            if client_etag == etag:
+                return {"unchanged": True, "etag": etag}
+
             # Get typhoons for specific year
             typhoons = self.get_typhoons_by_year(year)
-
-            # Try to load fishing grounds GeoJSON for this year
-            fishing_grounds_geojson = None
-            boat_detections_path = None
-
-            geojson_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "data",
-                "outputs",
-                "historical",
-                "phl",
-                str(year),
-                "intermediate",
-                f"phl_merged_dense_area_polygons_{year}.geojson",
-            )
-
-            if os.path.exists(geojson_path):
-                try:
-                    with open(geojson_path) as f:
-                        fishing_grounds_geojson = json.load(f)
-                    logger.info(f"Loaded fishing grounds GeoJSON for year {year}")
-                except Exception as e:
-                    logger.error(f"Error loading fishing grounds GeoJSON for year {year}: {e}")
-
-            # Build path to boat detections CSV
-            boat_csv_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "data",
-                "outputs",
-                "historical",
-                "phl",
-                str(year),
-                "intermediate",
-                f"df_all_b_phl_{year}.csv",
-            )
-
-            if os.path.exists(boat_csv_path):
-                boat_detections_path = boat_csv_path
-                logger.info(f"Found boat detections CSV for year {year}")
+            # The GeoJSON is cached on file mtime and the CSV lookup is one stat, so both run inline
+            fishing_grounds_geojson = self._load_fishing_grounds_geojson(year)
+            boat_csv_path = self._boat_csv_path(year)
 
             dashboard_data = {
                 "typhoons": typhoons,
                 "fishing_grounds_geojson": fishing_grounds_geojson,
-                "boat_detections_csv_path": boat_detections_path,
+                "boat_detections_csv_path": str(boat_csv_path) if boat_csv_path is not None else None,
                 "latest_year": year,
+                "etag": etag,
             }
 
             logger.info(f"Dashboard data prepared for year {year}")
@@ -324,14 +491,6 @@ class HistoricalApi(BaseApi):
             Dictionary with status information
         """
         try:
-            # Check if another run is active
-            with self._status_lock:
-                if self._analysis_status["status"] == "running":
-                    return {
-                        "status": "error",
-                        "message": "Another analysis is already running. Please wait or cancel it first.",
-                    }
-
             # Map country name to country code
             country_map = {
                 "philippines": "phl",
@@ -345,116 +504,31 @@ class HistoricalApi(BaseApi):
             country_code = country_map.get(country.lower(), country.lower())
 
             # Validate country code
-            from config import cyclone_seasons
-
             if country_code not in cyclone_seasons:
                 return {
                     "status": "error",
                     "message": f"Invalid country: {country}. Supported countries: {list(country_map.keys())}",
                 }
 
-            # Reset status
+            # Reject overlapping runs and reset status in one step. A cancelled job
+            # keeps the worker busy until its next progress callback, so it still counts.
             with self._status_lock:
-                self._analysis_status = {
-                    "status": "running",
-                    "current_phase": 0,
-                    "total_phases": 5,
-                    "phase_name": "Initializing...",
-                    "message": "Starting historical analysis...",
-                    "progress_percent": 0,
-                    "error_message": None,
-                }
-                self._cancellation_flag.clear()
-
-            # Start processing in background thread
-            def _run_analysis():
-                try:
-                    from backend.services.historical import Config, main
-                    from config import cyclone_seasons
-
-                    # Create config
-                    config = Config.from_defaults(
-                        country=country_code,
-                        year_selected=year,
-                        cyclone_seasons=cyclone_seasons,
-                        root_path="data",
-                    )
-                    config.ensure_paths_exist()
-
-                    # Define progress callback
-                    def progress_callback(phase: int, phase_name: str, message: str):
-                        """Update status as processing progresses."""
-                        # Check for cancellation
-                        if self._cancellation_flag.is_set():
-                            raise KeyboardInterrupt("Processing cancelled by user")
-                        self._update_status(phase, phase_name, message)
-
-                    # Run main processing with progress callback
-                    main(
-                        config,
-                        overwrite=overwrite,
-                        debug=False,
-                        read_from_file=False,
-                        progress_callback=progress_callback,
-                    )
-
-                    # Check for cancellation after main() completes
-                    if self._cancellation_flag.is_set():
-                        with self._status_lock:
-                            self._analysis_status["status"] = "cancelled"
-                            self._analysis_status["message"] = "Processing was cancelled"
-                        return
-
-                    # Update status: Phase 5 (database update)
-                    self._update_status(5, "Generating visualizations and updating database...", "Updating database...")
-
-                    # Call database update function
-                    from backend.services.historical_db_update import update_historical_database_from_run
-
-                    def db_progress_callback(phase: int, phase_name: str, message: str):
-                        """Progress callback for database update."""
-                        if self._cancellation_flag.is_set():
-                            raise KeyboardInterrupt("Processing cancelled by user")
-                        self._update_status(phase, phase_name, message)
-
-                    db_update_result = update_historical_database_from_run(
-                        country_code,
-                        year,
-                        config.output_path,
-                        db_path=get_database_path("database/historical.json"),
-                        progress_callback=db_progress_callback,
-                    )
-
-                    if db_update_result["status"] == "error":
-                        raise Exception(f"Database update failed: {db_update_result['message']}")
-
-                    logger.info(
-                        f"Database updated: {db_update_result.get('inserted_count', 0)} typhoons inserted, "
-                        f"{db_update_result.get('deleted_count', 0)} deleted"
-                    )
-
-                    # Mark as completed
-                    with self._status_lock:
-                        self._analysis_status["status"] = "completed"
-                        self._analysis_status["current_phase"] = 5
-                        self._analysis_status["progress_percent"] = 100
-                        self._analysis_status["message"] = "Analysis completed successfully"
-
-                except KeyboardInterrupt:
-                    # Handle cancellation
-                    with self._status_lock:
-                        self._analysis_status["status"] = "cancelled"
-                        self._analysis_status["message"] = "Processing was cancelled"
-                    logger.info("Historical analysis was cancelled")
-                except Exception as e:
-                    logger.error(f"Error in historical analysis: {e}", exc_info=True)
-                    with self._status_lock:
-                        self._analysis_status["status"] = "error"
-                        self._analysis_status["error_message"] = str(e)
-                        self._analysis_status["message"] = f"Error: {str(e)}"
-
-            self._processing_thread = threading.Thread(target=_run_analysis, daemon=True)
-            self._processing_thread.start()
+                if self._active_job is not None:
+                    if self._analysis_status.status == "running":
+                        message = "Another analysis is already running. Please wait or cancel it first."
+                    else:
+                        message = "The previous analysis is still stopping. Please try again shortly."
+                    return {"status": "error", "message": message}
+                self._analysis_status = AnalysisStatus(
+                    status="running",
+                    phase_name="Initializing...",
+                    message="Starting historical analysis...",
+                )
+                cancel_token = self._active_job = threading.Event()
+            self._status_dirty.set()
+
+            # Hand the job to the background worker
+            self._jobs.put_nowait((country_code, year, overwrite, cancel_token))
 
             return {
                 "status": "started",
@@ -468,6 +542,106 @@ class HistoricalApi(BaseApi):
                 "message": f"Failed to start analysis: {str(e)}",
             }
 
+    def _worker_loop(self):
+        """Run queued historical analysis jobs one at a time until closed."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            try:
+                self._run_analysis(*job)
+            finally:
+                with self._status_lock:
+                    if self._active_job is job[-1]:
+                        self._active_job = None
+
+    def _run_analysis(self, country_code: str, year: int, overwrite: bool, cancel_token: threading.Event):
+        """Run the historical pipeline and database update for one job.
+
+        Args:
+            country_code: ISO3 country code
+            year: Year for analysis
+            overwrite: Whether to overwrite existing data files
+            cancel_token: Set when this job is cancelled
+        """
+        try:
+            Config, main = _historical_pipeline()
+
+            # Create config
+            config = Config.from_defaults(
+                country=country_code,
+                year_selected=year,
+                cyclone_seasons=cyclone_seasons,
+                root_path="data",
+            )
+            config.ensure_paths_exist()
+
+            # Define progress callback
+            def progress_callback(phase: int, phase_name: str, message: str):
+                """Update status as processing progresses."""
+                # Check for cancellation
+                if cancel_token.is_set():
+                    raise KeyboardInterrupt("Processing cancelled by user")
+                self._update_status(phase, phase_name, message)
+
+            # Run main processing with progress callback
+            main(
+                config,
+                overwrite=overwrite,
+                debug=False,
+                read_from_file=False,
+                progress_callback=progress_callback,
+            )
+
+            # Check for cancellation after main() completes
+            if cancel_token.is_set():
+                self._set_status(status="cancelled", message="Processing was cancelled")
+                return
+
+            # Update status: Phase 5 (database update)
+            self._update_status(5, "Generating visualizations and updating database...", "Updating database...")
+
+            # Call database update function
+            update_historical_database_from_run = _historical_db_update()
+
+            def db_progress_callback(phase: int, phase_name: str, message: str):
+                """Progress callback for database update."""
+                if cancel_token.is_set():
+                    raise KeyboardInterrupt("Processing cancelled by user")
+                self._update_status(phase, phase_name, message)
+
+            db_update_result = update_historical_database_from_run(
+                country_code,
+                year,
+                config.output_path,
+                db_path=get_database_path("database/historical.json"),
+                progress_callback=db_progress_callback,
+            )
+
+            if db_update_result["status"] == "error":
+                raise Exception(f"Database update failed: {db_update_result['message']}")
+
+            logger.info(
+                f"Database updated: {db_update_result.get('inserted_count', 0)} typhoons inserted, "
+                f"{db_update_result.get('deleted_count', 0)} deleted"
+            )
+
+            # Mark as completed
+            self._set_status(
+                status="completed",
+                current_phase=5,
+                progress_percent=100,
+                message="Analysis completed successfully",
+            )
+
+        except KeyboardInterrupt:
+            # Handle cancellation
+            self._set_status(status="cancelled", message="Processing was cancelled")
+            logger.info("Historical analysis was cancelled")
+        except Exception as e:
+            logger.error(f"Error in historical analysis: {e}", exc_info=True)
+            self._set_status(status="error", error_message=str(e), message=f"Error: {str(e)}")
+
     def _update_status(self, phase: int, phase_name: str, message: str):
         """Update processing status (thread-safe).
 
@@ -476,12 +650,35 @@ class HistoricalApi(BaseApi):
             phase_name: Name of the current phase
             message: Detailed message about current step
         """
-        with self._status_lock:
-            self._analysis_status["current_phase"] = phase
-            self._analysis_status["phase_name"] = phase_name
-            self._analysis_status["message"] = message
+        # Always record the newest status; _push_status_loop coalesces bursts into one push
+        self._set_status(
+            current_phase=phase,
+            phase_name=phase_name,
+            message=message,
             # Calculate progress: each phase is 20% (100% / 5 phases)
-            self._analysis_status["progress_percent"] = int((phase / 5) * 100)
+            progress_percent=int((phase / 5) * 100),
+        )
+
+    def _set_status(self, **changes: Any):
+        """Swap in a new status snapshot with the given fields changed (thread-safe).
+
+        Args:
+            **changes: AnalysisStatus fields to update
+        """
+        with self._status_lock:
+            self._analysis_status = replace(self._analysis_status, **changes)
+        self._status_dirty.set()
+
+    def _push_status_loop(self):
+        """Push the latest status to the frontend, coalescing bursts of updates."""
+        while not self._closed:
+            self._status_dirty.wait()
+            if self._closed:
+                break
+            # Let further updates accumulate so only the most recent state is sent
+            time.sleep(STATUS_PUSH_INTERVAL)
+            self._status_dirty.clear()
+            self.notify_frontend("statusUpdate", self.get_historical_analysis_status())
 
     def get_historical_analysis_status(self) -> dict[str, Any]:
         """Get current status of historical analysis processing.
@@ -489,8 +686,8 @@ class HistoricalApi(BaseApi):
         Returns:
             Dictionary with status information
         """
-        with self._status_lock:
-            return self._analysis_status.copy()
+        # Snapshots are immutable, so a plain attribute load is consistent
+        return self._analysis_status.to_dict()
 
     def cancel_historical_analysis(self) -> dict[str, Any]:
         """Cancel the current historical analysis if running.
@@ -500,18 +697,20 @@ class HistoricalApi(BaseApi):
         """
         try:
             with self._status_lock:
-                if self._analysis_status["status"] != "running":
+                if self._analysis_status.status != "running" or self._active_job is None:
                     return {
                         "status": "error",
                         "message": "No analysis is currently running",
                     }
 
-                # Set cancellation flag
-                self._cancellation_flag.set()
+                # Cancel only the current job; later submissions get their own token
+                self._active_job.set()
 
                 # Update status
-                self._analysis_status["status"] = "cancelled"
-                self._analysis_status["message"] = "Cancellation requested..."
+                self._analysis_status = replace(
+                    self._analysis_status, status="cancelled", message="Cancellation requested..."
+                )
+            self._status_dirty.set()
 
             return {
                 "status": "cancelled",
@@ -527,5 +726,8 @@ class HistoricalApi(BaseApi):
 
     def close(self):
         """Clean up resources."""
+        self._closed = True
+        self._status_dirty.set()
+        self._jobs.put_nowait(None)
         if self.repository:
             self.repository.close()
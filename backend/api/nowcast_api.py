@@ -1,19 +1,72 @@
 """Nowcast API for PyWebView communication."""
 
-import json
+import functools
 import os
 import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 from backend.utils.logger import get_logger
 
+from ..models.analysis_status import AnalysisStatus
 from ..repositories.nowcast_repository import NowcastRepository
 from ..utils.utils import get_database_path, get_resource_path
 from .base_api import BaseApi
 
 logger = get_logger(__name__)
 
+# How often a waiting analysis worker checks for cancellation (seconds)
+CANCEL_POLL_INTERVAL = 0.25
+
+# Country names accepted from the UI, mapped to ISO3 codes
+COUNTRY_MAP = {
+    "philippines": "phl",
+    "vietnam": "vnm",
+    "thailand": "tha",
+    "fiji": "fji",
+    "vanuatu": "vut",
+    "bangladesh": "bgd",
+    "indonesia": "idn",
+}
+VALID_COUNTRY_CODES = frozenset(COUNTRY_MAP.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_fishing_grounds(geojson_path: str, mtime: float) -> tuple[dict[str, Any], ...]:
+    """Fishing grounds with display centroids, cached per GeoJSON modification time. Treat as read-only."""
+    # Imported here so app startup does not pay for numpy and shapely
+    import numpy as np
+    import shapely
+    from shapely.geometry import shape
+
+    with open(geojson_path, "rb") as f:
+        geojson_data = orjson.loads(f.read())
+
+    # Only polygons with a non-empty first ring get a display centroid
+    features = [feature for feature in geojson_data.get("features", []) if feature["geometry"]["coordinates"][0]]
+    if not features:
+        return ()
+    centroids = shapely.centroid(np.array([shape(feature["geometry"]) for feature in features]))
+    centroids = zip(shapely.get_x(centroids).tolist(), shapely.get_y(centroids).tolist(), strict=True)
+
+    # Transform GeoJSON features to the expected format
+    return tuple(
+        {
+            "id": feature["properties"]["contour_id"],
+            "name": f"Ground {feature['properties']['contour_id']}",
+            "lat": centroid_lat,
+            "lng": centroid_lng,
+            "description": f"Fishing ground {feature['properties']['contour_id']}",
+            "geometry": feature["geometry"],  # Keep full geometry for map display
+        }
+        for feature, (centroid_lng, centroid_lat) in zip(features, centroids, strict=True)
+    )
+
 
 class NowcastApi(BaseApi):
     """API class for nowcast typhoon dashboard communication."""
@@ -29,18 +82,16 @@ class NowcastApi(BaseApi):
         self.repository = NowcastRepository(db_path=db_path)
 
         # Status tracking for nowcast analysis processing
+        # Writers swap the snapshot under the lock; readers just load the attribute
         self._status_lock = threading.Lock()
-        self._analysis_status = {
-            "status": "idle",  # idle, running, completed, error, cancelled
-            "current_phase": 0,
-            "total_phases": 5,
-            "phase_name": "",
-            "message": "",
-            "progress_percent": 0,
-            "error_message": None,
-        }
+        self._analysis_status = AnalysisStatus()
         self._processing_thread = None
-        self._cancellation_flag = threading.Event()
+        # Each run gets its own cancel token and id; updates from superseded runs are dropped
+        self._cancel_token = threading.Event()
+        self._run_id = 0
+
+        # Held by the pipeline thread so an abandoned run cannot overlap the next one
+        self._pipeline_lock = threading.Lock()
 
         logger.info(f"Nowcast API initialized with database path: {db_path} and repository: {self.repository}")
 
@@ -113,30 +164,8 @@ class NowcastApi(BaseApi):
                 logger.error(f"Fishing grounds GeoJSON file not found: {geojson_path}")
                 return []
 
-            with open(geojson_path) as f:
-                geojson_data = json.load(f)
-
-            # Transform GeoJSON features to the expected format
-            fishing_grounds = []
-            for feature in geojson_data.get("features", []):
-                # Calculate centroid of the polygon for display
-                coords = feature["geometry"]["coordinates"][0]  # First ring of polygon
-                if coords:
-                    # Calculate centroid (simple average)
-                    lng_sum = sum(coord[0] for coord in coords)
-                    lat_sum = sum(coord[1] for coord in coords)
-                    centroid_lng = lng_sum / len(coords)
-                    centroid_lat = lat_sum / len(coords)
-
-                    ground = {
-                        "id": feature["properties"]["contour_id"],
-                        "name": f"Ground {feature['properties']['contour_id']}",
-                        "lat": centroid_lat,
-                        "lng": centroid_lng,
-                        "description": f"Fishing ground {feature['properties']['contour_id']}",
-                        "geometry": feature["geometry"],  # Keep full geometry for map display
-                    }
-                    fishing_grounds.append(ground)
+            # Parsed and centroided once per file version
+            fishing_grounds = list(_build_fishing_grounds(geojson_path, os.path.getmtime(geojson_path)))
 
             logger.info(f"Retrieved {len(fishing_grounds)} fishing grounds from GeoJSON")
             return fishing_grounds
@@ -242,7 +271,7 @@ class NowcastApi(BaseApi):
         try:
             # Check if another run is active
             with self._status_lock:
-                if self._analysis_status["status"] == "running":
+                if self._analysis_status.status == "running":
                     return {
                         "status": "error",
                         "message": "Another analysis is already running. Please wait or cancel it first.",
@@ -253,23 +282,13 @@ class NowcastApi(BaseApi):
                 year = datetime.now().year
 
             # Map country name to country code
-            country_map = {
-                "philippines": "phl",
-                "vietnam": "vnm",
-                "thailand": "tha",
-                "fiji": "fji",
-                "vanuatu": "vut",
-                "bangladesh": "bgd",
-                "indonesia": "idn",
-            }
-            country_code = country_map.get(country.lower(), country.lower())
+            country_code = COUNTRY_MAP.get(country.lower(), country.lower())
 
             # Validate country code
-            valid_countries = ["phl", "vnm", "tha", "fji", "vut", "bgd", "idn"]
-            if country_code not in valid_countries:
+            if country_code not in VALID_COUNTRY_CODES:
                 return {
                     "status": "error",
-                    "message": f"Invalid country: {country}. Supported countries: {list(country_map.keys())}",
+                    "message": f"Invalid country: {country}. Supported countries: {list(COUNTRY_MAP)}",
                 }
 
             # Validate uploaded file if provided
@@ -292,18 +311,17 @@ class NowcastApi(BaseApi):
                 # If using synthetic data, days parameter is ignored
                 ibtracs_days = 7
 
-            # Reset status
+            # Reset status and start a new run with its own cancel token
+            cancel_token = threading.Event()
             with self._status_lock:
-                self._analysis_status = {
-                    "status": "running",
-                    "current_phase": 0,
-                    "total_phases": 5,
-                    "phase_name": "Initializing...",
-                    "message": "Starting nowcast analysis...",
-                    "progress_percent": 0,
-                    "error_message": None,
-                }
-                self._cancellation_flag.clear()
+                self._analysis_status = AnalysisStatus(
+                    status="running",
+                    phase_name="Initializing...",
+                    message="Starting nowcast analysis...",
+                )
+                self._cancel_token = cancel_token
+                self._run_id += 1
+                run_id = self._run_id
 
             # Start processing in background thread
             def _run_analysis():
@@ -326,36 +344,40 @@ class NowcastApi(BaseApi):
                     def progress_callback(phase: int, phase_name: str, message: str):
                         """Update status as processing progresses."""
                         # Check for cancellation
-                        if self._cancellation_flag.is_set():
+                        if cancel_token.is_set():
                             raise KeyboardInterrupt("Processing cancelled by user")
-                        self._update_status(phase, phase_name, message)
+                        self._update_status(phase, phase_name, message, run_id)
 
                     # Run main processing with progress callback
-                    results = main(
-                        config=config,
-                        local_zip_path=local_zip_path,
-                        progress_callback=progress_callback,
-                        ibtracs_days=ibtracs_days_param,
+                    results = self._wait_cancellable(
+                        self._start_pipeline(
+                            main,
+                            config=config,
+                            local_zip_path=local_zip_path,
+                            progress_callback=progress_callback,
+                            ibtracs_days=ibtracs_days_param,
+                        ),
+                        cancel_token,
                     )
 
                     # Check for cancellation after main() completes
-                    if self._cancellation_flag.is_set():
-                        with self._status_lock:
-                            self._analysis_status["status"] = "cancelled"
-                            self._analysis_status["message"] = "Processing was cancelled"
+                    if cancel_token.is_set():
+                        self._set_status(run_id, status="cancelled", message="Processing was cancelled")
                         return
 
                     # Update status: Phase 5 (database update)
-                    self._update_status(5, "Creating visualizations and updating database...", "Updating database...")
+                    self._update_status(
+                        5, "Creating visualizations and updating database...", "Updating database...", run_id
+                    )
 
                     # Call database update function
                     from backend.services.nowcast_db_update import update_nowcast_database_from_run
 
                     def db_progress_callback(phase: int, phase_name: str, message: str):
                         """Progress callback for database update."""
-                        if self._cancellation_flag.is_set():
+                        if cancel_token.is_set():
                             raise KeyboardInterrupt("Processing cancelled by user")
-                        self._update_status(phase, phase_name, message)
+                        self._update_status(phase, phase_name, message, run_id)
 
                     db_update_result = update_nowcast_database_from_run(
                         country_code,
@@ -375,24 +397,21 @@ class NowcastApi(BaseApi):
                     )
 
                     # Mark as completed
-                    with self._status_lock:
-                        self._analysis_status["status"] = "completed"
-                        self._analysis_status["current_phase"] = 5
-                        self._analysis_status["progress_percent"] = 100
-                        self._analysis_status["message"] = "Analysis completed successfully"
+                    self._set_status(
+                        run_id,
+                        status="completed",
+                        current_phase=5,
+                        progress_percent=100,
+                        message="Analysis completed successfully",
+                    )
 
                 except KeyboardInterrupt:
                     # Handle cancellation
-                    with self._status_lock:
-                        self._analysis_status["status"] = "cancelled"
-                        self._analysis_status["message"] = "Processing was cancelled"
+                    self._set_status(run_id, status="cancelled", message="Processing was cancelled")
                     logger.info("Nowcast analysis was cancelled")
                 except Exception as e:
                     logger.error(f"Error in nowcast analysis: {e}", exc_info=True)
-                    with self._status_lock:
-                        self._analysis_status["status"] = "error"
-                        self._analysis_status["error_message"] = str(e)
-                        self._analysis_status["message"] = f"Error: {str(e)}"
+                    self._set_status(run_id, status="error", error_message=str(e), message=f"Error: {str(e)}")
 
             self._processing_thread = threading.Thread(target=_run_analysis, daemon=True)
             self._processing_thread.start()
@@ -409,20 +428,87 @@ class NowcastApi(BaseApi):
                 "message": f"Failed to start analysis: {str(e)}",
             }
 
-    def _update_status(self, phase: int, phase_name: str, message: str):
+    def _start_pipeline(self, fn, **kwargs) -> Future:
+        """Run a pipeline function on its own daemon thread.
+
+        Args:
+            fn: Function to run
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Future resolved with the function's result or exception
+        """
+        future = Future()
+
+        def _run():
+            with self._pipeline_lock:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(fn(**kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        threading.Thread(target=_run, daemon=True).start()
+        return future
+
+    def _wait_cancellable(self, future: Future, cancel_token: threading.Event):
+        """Wait for a pipeline future, giving up promptly if cancellation is requested.
+
+        Long blocking calls inside the pipeline (downloads, shapefile reads) never
+        reach a progress callback, so cancellation is also checked while waiting.
+        A run still waiting on the pipeline lock is cancelled before it starts;
+        one already running finishes or stops at its next progress callback.
+
+        Args:
+            future: Future returned by the pipeline executor
+            cancel_token: Cancel token of the run that owns the future
+
+        Returns:
+            The future's result
+
+        Raises:
+            KeyboardInterrupt: If cancellation was requested before the future finished
+        """
+        while True:
+            try:
+                return future.result(timeout=CANCEL_POLL_INTERVAL)
+            except FutureTimeoutError:
+                if cancel_token.is_set():
+                    # Only succeeds while the run is queued behind the pipeline lock
+                    future.cancel()
+                    raise KeyboardInterrupt("Processing cancelled by user") from None
+
+    def _update_status(self, phase: int, phase_name: str, message: str, run_id: int):
         """Update processing status (thread-safe).
 
         Args:
             phase: Current phase number (1-5)
             phase_name: Name of the current phase
             message: Detailed message about current step
+            run_id: Id of the run reporting progress
         """
-        with self._status_lock:
-            self._analysis_status["current_phase"] = phase
-            self._analysis_status["phase_name"] = phase_name
-            self._analysis_status["message"] = message
+        # Always record the newest status; the frontend polls and reads only the latest snapshot
+        self._set_status(
+            run_id,
+            current_phase=phase,
+            phase_name=phase_name,
+            message=message,
             # Calculate progress: each phase is 20% (100% / 5 phases)
-            self._analysis_status["progress_percent"] = int((phase / 5) * 100)
+            progress_percent=int((phase / 5) * 100),
+        )
+
+    def _set_status(self, run_id: int, **changes: Any):
+        """Swap in a new status snapshot with the given fields changed (thread-safe).
+
+        Args:
+            run_id: Id of the run making the change; ignored if a newer run has started
+            **changes: AnalysisStatus fields to update
+        """
+        with self._status_lock:
+            if run_id != self._run_id:
+                return
+            self._analysis_status = replace(self._analysis_status, **changes)
 
     def get_nowcast_analysis_status(self) -> dict[str, Any]:
         """Get current status of nowcast analysis processing.
@@ -430,8 +516,7 @@ class NowcastApi(BaseApi):
         Returns:
             Dictionary with status information
         """
-        with self._status_lock:
-            return self._analysis_status.copy()
+        return self._analysis_status.to_dict()
 
     def cancel_nowcast_analysis(self) -> dict[str, Any]:
         """Cancel the current nowcast analysis if running.
@@ -441,18 +526,19 @@ class NowcastApi(BaseApi):
         """
         try:
             with self._status_lock:
-                if self._analysis_status["status"] != "running":
+                if self._analysis_status.status != "running":
                     return {
                         "status": "error",
                         "message": "No analysis is currently running",
                     }
 
-                # Set cancellation flag
-                self._cancellation_flag.set()
+                # Cancel only the current run; a later run gets a fresh token
+                self._cancel_token.set()
 
                 # Update status
-                self._analysis_status["status"] = "cancelled"
-                self._analysis_status["message"] = "Cancellation requested..."
+                self._analysis_status = replace(
+                    self._analysis_status, status="cancelled", message="Cancellation requested..."
+                )
 
             return {
                 "status": "cancelled",
@@ -478,6 +564,7 @@ class NowcastApi(BaseApi):
         """
         try:
             import base64
+            import io
             import shutil
             import zipfile
 
@@ -490,8 +577,8 @@ class NowcastApi(BaseApi):
             upload_dir = os.path.join(project_root, "data", "inputs", "uploads", "temp")
             os.makedirs(upload_dir, exist_ok=True)
 
-            # Decode base64 data
-            file_bytes = base64.b64decode(file_data)
+            # Decode base64 data; the archive is read from memory and never written to disk
+            zip_buffer = io.BytesIO(base64.b64decode(file_data))
 
             # Create temporary directory for extraction (with timestamp to avoid conflicts)
             timestamp = int(datetime.now().timestamp())
@@ -499,17 +586,16 @@ class NowcastApi(BaseApi):
             os.makedirs(extract_dir, exist_ok=True)
 
             try:
-                # Save ZIP file temporarily
-                zip_path = os.path.join(extract_dir, filename)
-                with open(zip_path, "wb") as f:
-                    f.write(file_bytes)
-
                 # Extract ZIP file
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                with zipfile.ZipFile(zip_buffer, "r") as zip_ref:
                     zip_ref.extractall(extract_dir)
 
+                # List extracted files once; lowercase name -> actual name
+                with os.scandir(extract_dir) as entries:
+                    extracted = {entry.name.lower(): entry.name for entry in entries if entry.is_file()}
+
                 # Find .shp file in extracted contents
-                shp_files = [f for f in os.listdir(extract_dir) if f.lower().endswith(".shp")]
+                shp_files = [name for lower, name in extracted.items() if lower.endswith(".shp")]
 
                 if not shp_files:
                     raise ValueError(f"No .shp file found in ZIP archive: {filename}")
@@ -524,8 +610,7 @@ class NowcastApi(BaseApi):
                 missing_files = []
 
                 for ext in required_extensions:
-                    companion_file = os.path.join(extract_dir, f"{shp_basename}{ext}")
-                    if not os.path.exists(companion_file):
+                    if f"{shp_basename}{ext}".lower() not in extracted:
                         missing_files.append(f"{shp_basename}{ext}")
 
                 if missing_files:
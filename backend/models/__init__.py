@@ -1 +1,3 @@
 """Data models and schemas."""
+
+from .analysis_status import AnalysisStatus
@@ -0,0 +1,25 @@
+"""Status snapshot for background analysis runs."""
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisStatus:
+    """Immutable snapshot of a background analysis run.
+
+    Updates replace the whole snapshot (see dataclasses.replace), so readers
+    always see a consistent set of fields without taking a lock.
+    """
+
+    status: str = "idle"  # idle, running, completed, error, cancelled
+    current_phase: int = 0
+    total_phases: int = 5
+    phase_name: str = ""
+    message: str = ""
+    progress_percent: int = 0
+    error_message: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a plain dictionary for the frontend."""
+        return asdict(self)
@@ -1,32 +1,103 @@
 """Base repository for TinyDB operations."""
 
 import os
+from collections.abc import Callable
 from typing import Any
 
 from tinydb import Query, TinyDB
+from tinydb.storages import Storage
+
+from .storage import OrjsonStorage
 
 
 class BaseRepository:
     """Base class for data repositories using TinyDB."""
 
-    def __init__(self, db_path: str, table_name: str = "typhoons"):
+    def __init__(self, db_path: str, table_name: str = "typhoons", storage: type[Storage] = OrjsonStorage):
         """Initialize the repository with TinyDB connection.
 
         Args:
             db_path: Path to the TinyDB JSON file
             table_name: Name of the table to use (default: 'typhoons')
+            storage: TinyDB storage class for the file (default: OrjsonStorage)
         """
         # Ensure database directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
         # Initialize TinyDB
-        self.db = TinyDB(db_path)
+        self.db = TinyDB(db_path, storage=storage)
         self.table = self.db.table(table_name)
         self.db_path = db_path
 
+        # get_all() result, keyed by the file's (mtime_ns, size) so rewrites by other writers are picked up
+        self._all_cache: list[dict[str, Any]] = []
+        self._all_cache_key: tuple[int, int] | None = None
+
+        # Secondary indexes {field: {value: [records]}}, rebuilt from the cached records on reload
+        self._indexed_fields: set[str] = set()
+        self._indexes: dict[str, dict[Any, list[dict[str, Any]]]] = {}
+
+        # Subclass-defined projections of the cached records, dropped together with them
+        self._projections: dict[str, Any] = {}
+
+    def _invalidate_cache(self):
+        """Drop cached reads after a write through this repository."""
+        self._all_cache_key = None
+
+    def _records(self) -> list[dict[str, Any]]:
+        """Return the cached table contents, re-reading them if the file changed."""
+        # Stat before reading so a write landing in between forces a re-read next time
+        stat = os.stat(self.db_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key != self._all_cache_key:
+            self._all_cache = self.table.all()
+            self._all_cache_key = key
+            self._indexes = {}
+            self._projections = {}
+        return self._all_cache
+
+    def _projection(self, name: str, build: Callable[[list[dict[str, Any]]], Any]) -> Any:
+        """Return a value derived from all records, rebuilt only when the records are re-read.
+
+        Args:
+            name: Cache key for the projection
+            build: Function computing the projection from the list of records
+
+        Returns:
+            The (shared) projection
+        """
+        records = self._records()
+        if name not in self._projections:
+            self._projections[name] = build(records)
+        return self._projections[name]
+
+    def ensure_index(self, field: str):
+        """Serve get_by_field/get_all_by_field lookups on a field from an in-memory index.
+
+        Args:
+            field: Field name to index (values must be hashable)
+        """
+        self._indexed_fields.add(field)
+
+    def _lookup(self, field: str, value: Any) -> list[dict[str, Any]]:
+        """Return records whose field equals value, using the field's index."""
+        records = self._records()
+        index = self._indexes.get(field)
+        if index is None:
+            index = {}
+            for record in records:
+                if field in record:
+                    index.setdefault(record[field], []).append(record)
+            self._indexes[field] = index
+        return index.get(value, [])
+
     def get_all(self) -> list[dict[str, Any]]:
-        """Get all records from the table."""
-        return self.table.all()
+        """Get all records from the table.
+
+        Returns:
+            List of records (shared between calls, treat as read-only)
+        """
+        return list(self._records())
 
     def get_by_id(self, doc_id: int) -> dict[str, Any] | None:
         """Get a record by document ID."""
@@ -42,6 +113,9 @@ class BaseRepository:
         Returns:
             First matching record or None
         """
+        if field in self._indexed_fields:
+            matches = self._lookup(field, value)
+            return matches[0] if matches else None
         Q = Query()
         return self.table.get(Q[field] == value)
 
@@ -55,6 +129,8 @@ class BaseRepository:
         Returns:
             List of matching records
         """
+        if field in self._indexed_fields:
+            return list(self._lookup(field, value))
         Q = Query()
         return self.table.search(Q[field] == value)
 
@@ -67,6 +143,7 @@ class BaseRepository:
         Returns:
             Document ID of inserted record
         """
+        self._invalidate_cache()
         return self.table.insert(data)
 
     def update(self, doc_id: int, data: dict[str, Any]) -> list[int]:
@@ -79,6 +156,7 @@ class BaseRepository:
         Returns:
             List of updated document IDs
         """
+        self._invalidate_cache()
         return self.table.update(data, doc_ids=[doc_id])
 
     def delete_by_id(self, doc_id: int) -> list[int]:
@@ -90,6 +168,7 @@ class BaseRepository:
         Returns:
             List of deleted document IDs
         """
+        self._invalidate_cache()
         return self.table.remove(doc_ids=[doc_id])
 
     def delete_by_field(self, field: str, value: Any) -> list[int]:
@@ -103,10 +182,12 @@ class BaseRepository:
             List of deleted document IDs
         """
         Q = Query()
+        self._invalidate_cache()
         return self.table.remove(Q[field] == value)
 
     def truncate(self):
         """Clear all records from the table."""
+        self._invalidate_cache()
         self.table.truncate()
 
     def close(self):
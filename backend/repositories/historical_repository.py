@@ -1,11 +1,68 @@
 """Historical typhoon data repository."""
 
-import json
+import functools
 import os
+from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .base_repository import BaseRepository
 
+# Historical run outputs, laid out as {year}/intermediate/ under the country directory
+HISTORICAL_OUTPUT_DIR = Path(__file__).resolve().parents[2] / "data" / "outputs" / "historical" / "phl"
+
+
+def fishing_grounds_geojson_path(year: int) -> Path:
+    """Path of the merged dense-area polygons GeoJSON written by a historical run for a year."""
+    return HISTORICAL_OUTPUT_DIR / str(year) / "intermediate" / f"phl_merged_dense_area_polygons_{year}.geojson"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_fishing_grounds_geojson(geojson_path: Path, mtime: float) -> dict[str, Any]:
+    """Parsed fishing grounds GeoJSON, cached per modification time. Treat as read-only."""
+    with open(geojson_path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _build_summary(typhoons: list[dict[str, Any]]) -> dict[str, Any]:
+    """Derive the list, year and dashboard views of the historical records in one pass.
+
+    Args:
+        typhoons: All typhoon records
+
+    Returns:
+        Dictionary with typhoon_list, by_year, years, dashboard_typhoons and latest_year
+    """
+    typhoon_list = []
+    by_year: dict[Any, list[dict[str, Any]]] = {}
+    dashboard_typhoons = {}
+
+    for t in typhoons:
+        dashboard_data = t.get("dashboard_data", {})
+        year = dashboard_data.get("year")
+        typhoon_list.append(
+            {
+                "uuid": t["uuid"],
+                "name": t["name"],
+                "type": t["type"],
+                "date_range": dashboard_data.get("dates", "N/A"),
+                "track_points_count": len(t.get("track_points", [])),
+            }
+        )
+        by_year.setdefault(year, []).append(t)
+        # Use the actual typhoon name as key
+        dashboard_typhoons[t["name"]] = dashboard_data
+
+    years = sorted(year for year in by_year if year)
+    return {
+        "typhoon_list": typhoon_list,
+        "by_year": by_year,
+        "years": years,
+        "dashboard_typhoons": dashboard_typhoons,
+        "latest_year": years[-1] if years else None,
+    }
+
 
 class HistoricalRepository(BaseRepository):
     """Repository for historical typhoon data operations."""
@@ -17,6 +74,12 @@ class HistoricalRepository(BaseRepository):
             db_path: Path to the historical database file
         """
         super().__init__(db_path, table_name="typhoons")
+        self.ensure_index("uuid")
+        self.ensure_index("name")
+
+    def _summary(self) -> dict[str, Any]:
+        """Return the cached list/year/dashboard projection of all records."""
+        return self._projection("summary", _build_summary)
 
     def get_typhoon_list(self) -> list[dict[str, Any]]:
         """Get list of all typhoons with basic info.
@@ -24,17 +87,7 @@ class HistoricalRepository(BaseRepository):
         Returns:
             List of typhoon summary dictionaries
         """
-        typhoons = self.get_all()
-        return [
-            {
-                "uuid": t["uuid"],
-                "name": t["name"],
-                "type": t["type"],
-                "date_range": t.get("dashboard_data", {}).get("dates", "N/A"),
-                "track_points_count": len(t.get("track_points", [])),
-            }
-            for t in typhoons
-        ]
+        return list(self._summary()["typhoon_list"])
 
     def get_typhoon_by_uuid(self, typhoon_uuid: str) -> dict[str, Any] | None:
         """Get complete typhoon data by UUID.
@@ -64,43 +117,20 @@ class HistoricalRepository(BaseRepository):
         Returns:
             Dictionary with typhoons and fishing_grounds
         """
-        typhoons = self.get_all()
-        dashboard_typhoons = {}
-
-        for typhoon in typhoons:
-            # Use the actual typhoon name as key
-            key = typhoon["name"]
-            dashboard_typhoons[key] = typhoon.get("dashboard_data", {})
+        summary = self._summary()
+        dashboard_typhoons = dict(summary["dashboard_typhoons"])
 
         # Try to load fishing grounds from GeoJSON file
         fishing_grounds_geojson = None
 
         # Get the most recent year from typhoons
-        latest_year = None
-        for typhoon in typhoons:
-            year = typhoon.get("dashboard_data", {}).get("year")
-            if year and (latest_year is None or year > latest_year):
-                latest_year = year
+        latest_year = summary["latest_year"]
 
         if latest_year:
-            # Build path to GeoJSON file
-            geojson_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "data",
-                "outputs",
-                "historical",
-                "phl",
-                str(latest_year),
-                "intermediate",
-                f"phl_merged_dense_area_polygons_{latest_year}.geojson",
-            )
-
-            if os.path.exists(geojson_path):
-                try:
-                    with open(geojson_path) as f:
-                        fishing_grounds_geojson = json.load(f)
-                except Exception as e:
-                    print(f"Error loading fishing grounds GeoJSON: {e}")
+            try:
+                fishing_grounds_geojson = self.get_fishing_grounds_geojson(latest_year)
+            except Exception as e:
+                print(f"Error loading fishing grounds GeoJSON: {e}")
 
         return {
             "typhoons": dashboard_typhoons,
@@ -108,6 +138,20 @@ class HistoricalRepository(BaseRepository):
             "latest_year": latest_year,
         }
 
+    def get_fishing_grounds_geojson(self, year: int) -> dict[str, Any] | None:
+        """Get the merged fishing grounds GeoJSON for a year.
+
+        Args:
+            year: Year to load data for
+
+        Returns:
+            GeoJSON FeatureCollection (shared, treat as read-only) or None if the file does not exist
+        """
+        geojson_path = fishing_grounds_geojson_path(year)
+        if not os.path.exists(geojson_path):
+            return None
+        return _load_fishing_grounds_geojson(geojson_path, os.path.getmtime(geojson_path))
+
     def get_typhoons_by_year(self, year: int) -> list[dict[str, Any]]:
         """Get all typhoons for a specific year.
 
@@ -117,15 +161,7 @@ class HistoricalRepository(BaseRepository):
         Returns:
             List of typhoon records for the year
         """
-        all_typhoons = self.get_all()
-        filtered = []
-
-        for typhoon in all_typhoons:
-            typhoon_year = typhoon.get("dashboard_data", {}).get("year")
-            if typhoon_year == year:
-                filtered.append(typhoon)
-
-        return filtered
+        return list(self._summary()["by_year"].get(year, []))
 
     def get_available_years(self) -> list[int]:
         """Get all available years from the database.
@@ -133,12 +169,4 @@ class HistoricalRepository(BaseRepository):
         Returns:
             Sorted list of unique years
         """
-        typhoons = self.get_all()
-        years = set()
-
-        for typhoon in typhoons:
-            year = typhoon.get("dashboard_data", {}).get("year")
-            if year:
-                years.add(year)
-
-        return sorted(years)
+        return list(self._summary()["years"])
@@ -1,14 +1,72 @@
 """Nowcast typhoon data repository."""
 
+import math
 import uuid
 from datetime import datetime
 from typing import Any
 
-import geopandas as gpd
-import pandas as pd
-
 from .base_repository import BaseRepository
 
+# Per-fishing-ground columns of the nowcast daily CSV, ground 0-3
+BASELINE_COLUMNS = ["base_0", "base_1", "base_2", "base_3"]
+PREDICTED_COLUMNS = ["predict_g0", "predict_g1", "predict_g2", "predict_g3"]
+DISTANCE_COLUMNS = ["distance_0", "distance_1", "distance_2", "distance_3"]
+
+
+def activity_difference_label(base: float, pred: float, pct: float) -> str:
+    """Format the predicted change in boat activity for one fishing ground.
+
+    Args:
+        base: Baseline boat count
+        pred: Predicted boat count
+        pct: Percentage change from baseline to predicted
+
+    Returns:
+        Signed percentage such as "+12.50%", an infinite change as "+∞%"/"-∞%", or "N/A" if a count is missing
+    """
+    if base == 0 and pred == 0:
+        return "+0%"
+    if base == 0 and not math.isnan(pred):
+        return "+∞%"
+    if math.isnan(pct):
+        return "N/A"
+    if math.isinf(pct):
+        return "+∞%" if pct > 0 else "-∞%"
+    return f"{pct:+.2f}%"
+
+
+def nullable_ints(values: Any) -> list[int | None]:
+    """Convert a numeric column to ints, truncating like int() and mapping missing values to None.
+
+    Args:
+        values: Column (Series or array) to convert; non-numeric entries count as missing
+
+    Returns:
+        List of ints, with None where the value is missing
+    """
+    import pandas as pd
+
+    floats = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+    return [None if math.isnan(v) else int(v) for v in floats.tolist()]
+
+
+def typhoon_summary(track_points: list[dict[str, Any]], daily_data: dict[str, Any]) -> dict[str, Any]:
+    """Summary fields stored on each typhoon record so listing typhoons needs no per-record work.
+
+    Args:
+        track_points: Track point dictionaries
+        daily_data: Daily data keyed by date
+
+    Returns:
+        Dictionary with 'date_range' and 'track_points_count'
+    """
+    if not daily_data:
+        date_range = "No data"
+    else:
+        first, last = min(daily_data), max(daily_data)
+        date_range = first if first == last else f"{first} to {last}"
+    return {"date_range": date_range, "track_points_count": len(track_points)}
+
 
 class NowcastRepository(BaseRepository):
     """Repository for nowcast typhoon data operations."""
@@ -20,15 +78,7 @@ class NowcastRepository(BaseRepository):
             db_path: Path to the nowcast database file
         """
         super().__init__(db_path, table_name="typhoons")
-
-    def get_all(self) -> list[dict[str, Any]]:
-        """Get all typhoon records.
-
-        Returns:
-            List of all typhoon dictionaries
-        """
-        # TinyDB returns Document objects which behave like dicts
-        return [dict(doc) for doc in self.table.all()]
+        self.ensure_index("uuid")
 
     def create_typhoon_record(self, name: str, csv_path: str, shapefile_path: str) -> str | None:
         """Create a new typhoon record from CSV and shapefile data.
@@ -58,8 +108,9 @@ class NowcastRepository(BaseRepository):
                 "name": name,
                 "type": "TY",  # Default type
                 "track_points": track_points,
-                "daily_data": {day["date"]: day for day in daily_data},
+                "daily_data": daily_data,
                 "created_at": datetime.now().isoformat(),
+                **typhoon_summary(track_points, daily_data),
             }
 
             # Save to database using TinyDB
@@ -84,8 +135,12 @@ class NowcastRepository(BaseRepository):
                 "uuid": t["uuid"],
                 "name": t["name"],
                 "type": t["type"],
-                "date_range": self._get_date_range(t.get("daily_data", {})),
-                "track_points_count": len(t.get("track_points", [])),
+                # Records written before summaries were stored fall back to computing them
+                **(
+                    {"date_range": t["date_range"], "track_points_count": t["track_points_count"]}
+                    if "track_points_count" in t
+                    else typhoon_summary(t.get("track_points", []), t.get("daily_data", {}))
+                ),
             }
             for t in typhoons
         ]
@@ -97,7 +152,7 @@ class NowcastRepository(BaseRepository):
             typhoon_uuid: Typhoon UUID
 
         Returns:
-            Typhoon data or None if not found
+            Typhoon data (shared, treat as read-only) or None if not found
         """
         return self.get_by_field("uuid", typhoon_uuid)
 
@@ -110,10 +165,14 @@ class NowcastRepository(BaseRepository):
         Returns:
             Sorted list of date strings
         """
-        typhoon = self.get_typhoon_by_uuid(typhoon_uuid)
-        if typhoon and "daily_data" in typhoon:
-            return sorted(typhoon["daily_data"].keys())
-        return []
+        # Per-UUID results, dropped with the cached records when the database changes
+        dates_by_uuid = self._projection("typhoon_dates", lambda _records: {})
+        if typhoon_uuid not in dates_by_uuid:
+            typhoon = self.get_typhoon_by_uuid(typhoon_uuid)
+            dates_by_uuid[typhoon_uuid] = (
+                sorted(typhoon["daily_data"].keys()) if typhoon and "daily_data" in typhoon else []
+            )
+        return list(dates_by_uuid[typhoon_uuid])
 
     def delete_typhoon(self, typhoon_uuid: str) -> bool:
         """Delete a typhoon record by UUID.
@@ -132,49 +191,63 @@ class NowcastRepository(BaseRepository):
             print(f"Error deleting typhoon: {e}")
             return False
 
-    def process_csv_data(self, csv_path: str) -> list[dict[str, Any]]:
+    def process_csv_data(self, csv_path: str) -> dict[str, dict[str, Any]]:
         """Process CSV data and return structured daily data.
 
         Args:
             csv_path: Path to CSV file
 
         Returns:
-            List of daily data dictionaries
+            Daily data dictionaries keyed by date
         """
         try:
+            # Imported here so app startup does not pay for numpy and pandas
+            import numpy as np
+            import pandas as pd
+
             df = pd.read_csv(csv_path)
-            daily_data = []
-
-            for _, row in df.iterrows():
-                # Calculate activity differences
-                baseline = [row["base_0"], row["base_1"], row["base_2"], row["base_3"]]
-                predicted = [row["predict_g0"], row["predict_g1"], row["predict_g2"], row["predict_g3"]]
-
-                activity_diff = []
-                for base, pred in zip(baseline, predicted, strict=False):
-                    if base == 0:
-                        diff = "+0%" if pred == 0 else "+∞%"
-                    else:
-                        percentage = ((pred - base) / base) * 100
-                        diff = f"{'+' if percentage >= 0 else ''}{percentage:.2f}%"
-                    activity_diff.append(diff)
-
-                daily_record = {
-                    "date": row["date_only"],
-                    "avgStormSpeed": f"{row['stm_spd_mean']:.1f} knots",
-                    "maxStormSpeed": f"{row['stm_spd_max']} knots",
-                    "maxWindSpeed": f"{row['USA_WIND']} knots",
-                    "distances": [row["distance_0"], row["distance_1"], row["distance_2"], row["distance_3"]],
-                    "boatCounts": {"baseline": baseline, "predicted": predicted},
-                    "activityDifference": activity_diff,
-                }
-                daily_data.append(daily_record)
 
-            return daily_data
+            # Calculate activity differences for all days and grounds at once
+            baseline = df[BASELINE_COLUMNS].to_numpy(dtype=float)
+            predicted = df[PREDICTED_COLUMNS].to_numpy(dtype=float)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                percentage = (predicted - baseline) / baseline * 100
+            activity_diff = [
+                [
+                    activity_difference_label(base, pred, pct)
+                    for base, pred, pct in zip(base_row, pred_row, pct_row, strict=True)
+                ]
+                for base_row, pred_row, pct_row in zip(
+                    baseline.tolist(), predicted.tolist(), percentage.tolist(), strict=True
+                )
+            ]
+
+            return {
+                date: {
+                    "date": date,
+                    "avgStormSpeed": f"{avg_speed:.1f} knots",
+                    "maxStormSpeed": f"{max_speed} knots",
+                    "maxWindSpeed": f"{max_wind} knots",
+                    "distances": distances,
+                    "boatCounts": {"baseline": base, "predicted": pred},
+                    "activityDifference": diff,
+                }
+                for date, avg_speed, max_speed, max_wind, distances, base, pred, diff in zip(
+                    df["date_only"].tolist(),
+                    df["stm_spd_mean"].tolist(),
+                    df["stm_spd_max"].tolist(),
+                    df["USA_WIND"].tolist(),
+                    df[DISTANCE_COLUMNS].to_numpy().tolist(),
+                    df[BASELINE_COLUMNS].to_numpy().tolist(),
+                    df[PREDICTED_COLUMNS].to_numpy().tolist(),
+                    activity_diff,
+                    strict=True,
+                )
+            }
 
         except Exception as e:
             print(f"Error processing CSV data: {e}")
-            return []
+            return {}
 
     def process_shapefile_data(self, shapefile_path: str) -> list[dict[str, Any]]:
         """Process shapefile data and return track points.
@@ -186,48 +259,36 @@ class NowcastRepository(BaseRepository):
             List of track point dictionaries
         """
         try:
-            gdf = gpd.read_file(shapefile_path)
-            track_points = []
+            # Imported here so app startup does not pay for geopandas
+            import geopandas as gpd
+            import numpy as np
+            import pandas as pd
 
-            for _, row in gdf.iterrows():
-                # Extract geometry coordinates
-                point = row.geometry
-                lat, lng = point.y, point.x
+            gdf = gpd.read_file(shapefile_path)
 
-                # Format datetime
-                dt = datetime(row["year"], row["month"], row["day"], row["hour"], row["minute"])
-                datetime_str = dt.strftime("%Y-%m-%d %H:%M")
+            # Build timestamps for all points at once and sort chronologically
+            timestamps = pd.to_datetime(gdf[["year", "month", "day", "hour", "minute"]])
+            order = np.argsort(timestamps.to_numpy(), kind="stable")
 
-                track_point = {
-                    "lat": float(lat),
-                    "lng": float(lng),
+            return [
+                {
+                    "lat": lat,
+                    "lng": lng,
                     "datetime": datetime_str,
-                    "windSpeed": int(row["USA_WIND"]),
-                    "cycloneSpeed": int(row["STORM_SPD"]),
+                    "windSpeed": wind_speed,
+                    "cycloneSpeed": cyclone_speed,
                 }
-                track_points.append(track_point)
-
-            # Sort by datetime
-            track_points.sort(key=lambda x: str(x["datetime"]))
-            return track_points
+                for lat, lng, datetime_str, wind_speed, cyclone_speed in zip(
+                    gdf.geometry.y.to_numpy()[order].tolist(),
+                    gdf.geometry.x.to_numpy()[order].tolist(),
+                    timestamps.dt.strftime("%Y-%m-%d %H:%M").to_numpy()[order].tolist(),
+                    # Track points between advisories can lack wind or speed values
+                    nullable_ints(gdf["USA_WIND"].iloc[order]),
+                    nullable_ints(gdf["STORM_SPD"].iloc[order]),
+                    strict=True,
+                )
+            ]
 
         except Exception as e:
             print(f"Error processing shapefile data: {e}")
             return []
-
-    def _get_date_range(self, daily_data: dict[str, Any]) -> str:
-        """Get date range string from daily data.
-
-        Args:
-            daily_data: Dictionary of daily data keyed by date
-
-        Returns:
-            Date range string
-        """
-        if not daily_data:
-            return "No data"
-
-        dates = sorted(daily_data.keys())
-        if len(dates) == 1:
-            return dates[0]
-        return f"{dates[0]} to {dates[-1]}"
@@ -0,0 +1,56 @@
+"""TinyDB storage backends."""
+
+import json
+import os
+from typing import Any
+
+import orjson
+from tinydb.storages import JSONStorage
+
+# numpy scalars and non-string keys are accepted, matching what the stdlib encoder tolerated
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonStorage(JSONStorage):
+    """JSON file storage that (de)serializes with orjson on a binary handle.
+
+    The file format is plain JSON, so databases remain readable by the default
+    TinyDB storage. orjson writes non-ASCII characters as UTF-8 rather than
+    escaping them. Files written by the stdlib encoder may contain NaN/Infinity
+    literals, which orjson rejects; those are read with the stdlib parser.
+
+    Non-finite floats (NaN, Infinity, including numpy scalars and arrays) are
+    written as null, where the stdlib encoder wrote NaN/Infinity literals. The
+    file stays strict JSON that the frontend can parse; after a round trip,
+    readers get None instead of a float NaN.
+    """
+
+    def __init__(self, path: str, create_dirs: bool = False, access_mode: str = "rb+", **kwargs):
+        """Open the database file.
+
+        Args:
+            path: Path to the JSON file
+            create_dirs: Whether to create missing parent directories
+            access_mode: Binary file mode ("rb" or "rb+")
+            **kwargs: Passed through to JSONStorage
+        """
+        super().__init__(path, create_dirs=create_dirs, access_mode=access_mode, **kwargs)
+
+    def read(self) -> dict[str, dict[str, Any]] | None:
+        """Read the whole database, or None if the file is empty."""
+        self._handle.seek(0)
+        data = self._handle.read()
+        if not data:
+            return None
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def write(self, data: dict[str, dict[str, Any]]):
+        """Replace the file contents with the serialized database; non-finite floats become null."""
+        self._handle.seek(0)
+        self._handle.write(orjson.dumps(data, option=ORJSON_OPTIONS))
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.truncate()
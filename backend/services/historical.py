@@ -1,9 +1,13 @@
 # flake8: noqa: E501
+import importlib.util
 import os
 import re
 import sys
+import threading
 import time
+import weakref
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import contextily as ctx
@@ -24,13 +28,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import requests
+import shapely
 import urllib3
-from bs4 import BeautifulSoup
 from geopy.distance import geodesic
 from matplotlib import patheffects
-from scipy import stats
-from shapely.errors import TopologicalError
-from shapely.geometry import Point, Polygon, box, shape
+from requests.adapters import HTTPAdapter
+from scipy import signal
+from shapely.geometry import Polygon, box
 from shapely.validation import make_valid
 
 from backend.utils.helper import (
@@ -46,6 +50,29 @@ from config import cyclone_seasons
 urllib3.disable_warnings()
 logger = get_logger(__name__)
 REQUEST_TIMEOUT = int(os.getenv("HTTP_REQUEST_TIMEOUT", "30"))
+# Write the large debug-only intermediate CSVs that no later stage reads back
+DEBUG_DUMP = os.getenv("FISHING_DEBUG_DUMP", "False").lower() in ("true", "1", "t", "yes")
+
+# Read/write vector files through pyogrio's bulk reader when it is installed; None keeps geopandas' default (fiona)
+GPD_ENGINE = "pyogrio" if importlib.util.find_spec("pyogrio") else None
+
+# Bytes written per chunk when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Concurrent daily VIIRS file downloads (and pooled connections) per season
+VIIRS_DOWNLOAD_WORKERS = 8
+
+# VIIRS QF_Detect values kept as boat detections
+BOAT_QF_VALUES = [1, 2, 3, 8, 10]
+
+# Columns identifying a single VIIRS boat detection; a day present as both .csv and .csv.gz yields duplicate rows
+VIIRS_DETECTION_KEY = ["Date_Mscan", "Lat_DNB", "Lon_DNB"]
+
+# Threads used to parse the daily VIIRS CSVs when merging a season
+VIIRS_READ_WORKERS = min(8, os.cpu_count() or 1)
+
+# VIIRS daily boat detection file links in the raw directory listing: file name, year, month, day, country code
+VIIRS_FILE_RE = re.compile(rb'href="(VBD_npp_d(\d{4})(\d{2})(\d{2})_([A-Za-z-]+)_noaa_ops_v23\.csv(?:\.gz)?)"')
 
 
 # from config import (
@@ -59,6 +86,75 @@ REQUEST_TIMEOUT = int(os.getenv("HTTP_REQUEST_TIMEOUT", "30"))
 # )
 
 
+def save_response(response, file_path, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """
+    Writes a streamed HTTP response body to a file chunk by chunk.
+
+    Parameters:
+    - response (requests.Response): Response opened with `stream=True`.
+    - file_path (str): Destination file path.
+    - chunk_size (int): Bytes read per chunk.
+
+    The body is decoded the same way as `response.content` (any Content-Encoding is undone), but never
+    held in memory as a whole.
+    """
+    with open(file_path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+
+
+def viirs_season_windows(year_selected, country, cyclone_seasons, today):
+    """
+    Builds the cyclone season date windows for which VIIRS files are downloaded.
+
+    Parameters:
+    - year_selected (int): The year for which data is being downloaded.
+    - country (str): The country code for which data is needed.
+    - cyclone_seasons (dict): Dictionary of cyclone seasons per country, specifying start and end months.
+    - today (tuple): Current date as (year, month, day); windows of the current year stop there.
+
+    Returns:
+    - windows (list): Inclusive ((year, month, day), (year, month, day)) bounds, one per season. Seasons with
+      end_month < start_month run into the following year.
+    """
+    windows = []
+    if country in cyclone_seasons:
+        seasons = cyclone_seasons[country] if isinstance(cyclone_seasons[country], list) else [cyclone_seasons[country]]
+
+        for season in seasons:
+            start_month = season["start_month"]
+            end_month = season["end_month"]
+            end_year = year_selected if start_month <= end_month else year_selected + 1
+            window_end = (end_year, end_month, 31)
+            if year_selected >= today[0]:
+                # For the current year, limit to cyclone season days up to today
+                window_end = min(window_end, today)
+            windows.append(((year_selected, start_month, 1), window_end))
+    return windows
+
+
+def select_viirs_files(html, country, windows):
+    """
+    Picks a country's daily VIIRS files dated inside any season window from the raw directory listing.
+
+    Parameters:
+    - html (bytes): Raw directory listing of the VIIRS daily data URL.
+    - country (str): The country code for which data is needed.
+    - windows (list): Inclusive date windows from `viirs_season_windows`.
+
+    Returns:
+    - csv_files (list): Matching file names, in listing order.
+    """
+    # Match on the raw bytes; only the matched file names are decoded
+    country_code = country.encode("ascii")
+    csv_files = []
+    for file_name, year, month, day, file_country in VIIRS_FILE_RE.findall(html):
+        file_date = (int(year), int(month), int(day))
+        if file_country == country_code and any(start <= file_date <= end for start, end in windows):
+            csv_files.append(file_name.decode("ascii"))
+    return csv_files
+
+
 @time_execution("downloading VIIRS data")
 def download_viirs_data(year_selected, country, viirs_path, cyclone_seasons, overwrite=False):
     """
@@ -75,80 +171,56 @@ def download_viirs_data(year_selected, country, viirs_path, cyclone_seasons, ove
     to the specified path, logging successes and any download errors.
     """
 
-    # Get current year and month to handle current year data constraints
-    current_year = datetime.now().year
-    current_month = datetime.now().month
-    current_day = datetime.now().day
-
-    # Set URLs from the data source (VIIRS)
-    access_token = get_access_token()
-    headers = {"Authorization": "Bearer " + access_token}
+    # Files dated after today are not considered when the current year is selected
+    now = datetime.now()
+    today = (now.year, now.month, now.day)
+
+    # Set URLs from the data source (VIIRS). One session carries the token and keeps connections alive
+    # across the listing and the per-day downloads. Reuse the token from the login step when there is one.
+    access_token = get_eog_access_token() or get_access_token()
+    session = requests.Session()
+    session.headers.update({"Authorization": "Bearer " + access_token})
+    adapter = HTTPAdapter(pool_connections=VIIRS_DOWNLOAD_WORKERS, pool_maxsize=VIIRS_DOWNLOAD_WORKERS)
+    session.mount("https://", adapter)
     data_url = f"https://eogdata.mines.edu/wwwdata/viirs_products/vbd/v23/{country}/final/daily/"
-    response = requests.get(data_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    response = session.get(data_url, timeout=REQUEST_TIMEOUT)
     logger.info(f"Response: {response}")
 
     if response.status_code != 200:
         logger.error(f"Failed to access data URL: {data_url}. Status code: {response.status_code}")
+        session.close()
         return
 
-    html = response.text
     logger.info(f"VIIRS Path: {viirs_path}")
 
-    csv_files = []
-
-    if country in cyclone_seasons:
-        seasons = cyclone_seasons[country] if isinstance(cyclone_seasons[country], list) else [cyclone_seasons[country]]
-
-        for season in seasons:
-            start_month = season["start_month"]
-            end_month = season["end_month"]
-
-            if year_selected < current_year:
-                # For past years, download data for the full cyclone season
-                if start_month <= end_month:
-                    months_pattern = f"({'|'.join(f'{month:02d}' for month in range(start_month, end_month + 1))})"
-                    pattern = rf'href="(VBD_npp_d{year_selected}{months_pattern}(0[1-9]|[12][0-9]|3[01])_{country}_noaa_ops_v23\.csv(\.gz)?)"'
-                    csv_files.extend(re.findall(pattern, html))
-                else:
-                    months_pattern_current_year = f"({'|'.join(f'{month:02d}' for month in range(start_month, 13))})"
-                    months_pattern_next_year = f"({'|'.join(f'{month:02d}' for month in range(1, end_month + 1))})"
-                    pattern_current_year = rf'href="(VBD_npp_d{year_selected}{months_pattern_current_year}(0[1-9]|[12][0-9]|3[01])_{country}_noaa_ops_v23\.csv(\.gz)?)"'
-                    pattern_next_year = rf'href="(VBD_npp_d{year_selected + 1}{months_pattern_next_year}(0[1-9]|[12][0-9]|3[01])_{country}_noaa_ops_v23\.csv(\.gz)?)"'
-                    csv_files.extend(re.findall(pattern_current_year, html) + re.findall(pattern_next_year, html))
-            else:
-                # For the current year, limit to cyclone season months up to current month/day
-                if start_month <= end_month:
-                    # If within a single year
-                    months_pattern = f"({'|'.join(f'{month:02d}' for month in range(start_month, current_month + 1))})"
-                    days_pattern = (
-                        "(0[1-9]|[12][0-9]|3[01])"
-                        if current_month > end_month
-                        else f"(0[1-9]|[12][0-9]|{current_day:02d})"
-                    )
-                    pattern = rf'href="(VBD_npp_d{year_selected}{months_pattern}{days_pattern}_{country}_noaa_ops_v23\.csv(\.gz)?)"'
-                    csv_files.extend(re.findall(pattern, html))
-                else:
-                    # Handles year-spanning seasons
-                    months_pattern_current_year = f"({'|'.join(f'{month:02d}' for month in range(start_month, 13))})"
-                    days_pattern_current = (
-                        "(0[1-9]|[12][0-9]|3[01])" if current_month > 12 else f"(0[1-9]|[12][0-9]|{current_day:02d})"
-                    )
-                    months_pattern_next_year = f"({'|'.join(f'{month:02d}' for month in range(1, end_month + 1))})"
-                    pattern_current_year = rf'href="(VBD_npp_d{year_selected}{months_pattern_current_year}{days_pattern_current}_{country}_noaa_ops_v23\.csv(\.gz)?)"'
-                    pattern_next_year = rf'href="(VBD_npp_d{year_selected + 1}{months_pattern_next_year}(0[1-9]|[12][0-9]|3[01])_{country}_noaa_ops_v23\.csv(\.gz)?)"'
-                    csv_files.extend(re.findall(pattern_current_year, html) + re.findall(pattern_next_year, html))
+    # Scan the listing once and keep this country's files dated inside a season window
+    windows = viirs_season_windows(year_selected, country, cyclone_seasons, today)
+    csv_files = select_viirs_files(response.content, country, windows)
 
     # Check if any files were found; if none, log an error and exit
     if not csv_files:
         logger.error(
             f"No VIIRS data files available for {country} in {year_selected} within the defined cyclone period."
         )
+        session.close()
         raise Exception(
             f"No VIIRS data files available for {country} in {year_selected} within the defined cyclone period."
         )
 
-    for csv_file in set(csv_files):
-        csv_file_name = csv_file[0]
+    token_lock = threading.Lock()
+
+    def refresh_access_token(stale_authorization):
+        # Several downloads can hit an expired token together; only the first one logs in again
+        with token_lock:
+            if session.headers["Authorization"] != stale_authorization:
+                return
+            logger.info("EOG access token expired. Logging in again...")
+            access_token = get_access_token()
+            if access_token:
+                update_eog_access_token(access_token)
+                session.headers["Authorization"] = "Bearer " + access_token
+
+    def fetch_csv(csv_file_name):
         logger.info(f"Found file: {csv_file_name}")
         csv_url = data_url + csv_file_name
         csv_file_path = os.path.join(viirs_path, csv_file_name)
@@ -156,18 +228,28 @@ def download_viirs_data(year_selected, country, viirs_path, cyclone_seasons, ove
 
         if not overwrite and os.path.exists(csv_file_path):
             logger.info("File already exists and overwrite is set to False. Skipping...")
-            continue
-
-        response = requests.get(csv_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            return
+
+        authorization = session.headers["Authorization"]
+        response = session.get(csv_url, timeout=REQUEST_TIMEOUT, stream=True)
+        if response.status_code == 401:
+            # Retry once with a fresh token
+            response.close()
+            refresh_access_token(authorization)
+            response = session.get(csv_url, timeout=REQUEST_TIMEOUT, stream=True)
+
+        with response:
+            if response.status_code == 200:
+                os.makedirs(os.path.dirname(csv_file_path), exist_ok=True)
+
+                save_response(response, csv_file_path)
+                logger.info(f"Downloaded and saved: {csv_file_path}")
+            else:
+                logger.error(f"Failed to download {csv_url}. Status code: {response.status_code}")
 
-        if response.status_code == 200:
-            os.makedirs(os.path.dirname(csv_file_path), exist_ok=True)
-
-            with open(csv_file_path, "wb") as f:
-                f.write(response.content)
-            logger.info(f"Downloaded and saved: {csv_file_path}")
-        else:
-            logger.error(f"Failed to download {csv_url}. Status code: {response.status_code}")
+    # Downloads are latency bound, so fetch several days at once over the shared session
+    with session, ThreadPoolExecutor(max_workers=VIIRS_DOWNLOAD_WORKERS) as executor:
+        list(executor.map(fetch_csv, dict.fromkeys(csv_files)))
 
 
 # Step 2: Merge VIIRS data
@@ -187,30 +269,31 @@ def merge_viirs_data(viirs_path, year_selected, country, output_path):
     """
 
     df_append = pd.DataFrame()
-    list_df = []
 
-    # Create a regex pattern to match filenames with the selected year and country
-    file_pattern_csv = f"VBD_npp_d{year_selected}.*_{country}_noaa_ops_v23\\.csv"
-    file_pattern_gz = f"VBD_npp_d{year_selected}.*_{country}_noaa_ops_v23\\.csv\\.gz"
+    # Filenames with the selected year and country, plain or gzipped
+    prefix = f"VBD_npp_d{year_selected}"
+    suffixes = (f"_{country}_noaa_ops_v23.csv", f"_{country}_noaa_ops_v23.csv.gz")
 
     # Check if the directory exists
     if os.path.exists(viirs_path):
-        viirs_files = os.listdir(viirs_path)
         try:
-            for file in viirs_files:
-                # Check if the file matches either the .csv or .csv.gz pattern
-                if re.match(file_pattern_csv, file) or re.match(file_pattern_gz, file):
-                    full_file_path = os.path.join(viirs_path, file)
-                    if file.endswith(".gz"):
-                        data = pd.read_csv(full_file_path, compression="gzip")
-                    else:
-                        data = pd.read_csv(full_file_path)
-                    list_df.append(data)
+            with os.scandir(viirs_path) as entries:
+                matching_files = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(suffixes) and entry.is_file()
+                ]
+
+            # Parse the daily files on a few threads; the CSV tokenizer and gzip decompression release the GIL.
+            # read_csv infers gzip compression from the .gz suffix. map() keeps the directory order.
+            with ThreadPoolExecutor(max_workers=VIIRS_READ_WORKERS) as executor:
+                list_df = list(executor.map(pd.read_csv, matching_files))
 
             if list_df:  # If there are matching files
                 # Merge all VIIRS data into one dataframe
                 df_append = pd.concat(list_df)
-                df_append.to_csv(os.path.join(output_path, f"df_append_{country}_{year_selected}.csv"))
+                if DEBUG_DUMP:
+                    df_append.to_csv(os.path.join(output_path, f"df_append_{country}_{year_selected}.csv"))
                 logger.info(df_append.head(3))  # Print the head of the dataframe
             else:
                 logger.info(f"No files found for country: {country} and year: {year_selected}")
@@ -264,29 +347,24 @@ def download_and_process_cyclone_data(gis_path, cyclone_seasons, country, year_s
         logger.error(f"Failed to download page: status code {response.status_code}")
         raise Exception(f"Failed to download page: status code {response.status_code}")
 
-    # Parse the HTML page to find the ZIP file link
-    soup = BeautifulSoup(response.content, "html.parser")
-    zip_link = None
-    for a in soup.find_all("a", href=True):
-        if tracks_file_name in a["href"]:
-            zip_link = base_url + a["href"]
-            break
+    # Find the ZIP file link; the file name is known, so a direct href match is enough
+    match = re.search(rf'href="([^"]*{re.escape(tracks_file_name)}[^"]*)"', response.text)
+    zip_link = base_url + match.group(1) if match else None
 
     if not zip_link:
         logger.error("ZIP file link not found on the page.")
         raise Exception("ZIP file link for {tracks_file_name} not found on the page.")
 
-    # Download the ZIP file
+    # Download the ZIP file, streaming it to disk rather than holding it in memory
     logger.info(f"Downloading ZIP file: {zip_link}")
-    zip_response = requests.get(zip_link, timeout=REQUEST_TIMEOUT)
-    if zip_response.status_code == 200:
-        tracks_file_path = os.path.join(gis_path, tracks_file_name)
-        logger.info(f"Saving ZIP file to: {tracks_file_path}")
-        with open(tracks_file_path, "wb") as f:
-            f.write(zip_response.content)
-    else:
-        logger.error(f"Failed to download ZIP file: status code {zip_response.status_code}")
-        raise Exception(f"Failed to download ZIP file: status code {zip_response.status_code}")
+    with requests.get(zip_link, timeout=REQUEST_TIMEOUT, stream=True) as zip_response:
+        if zip_response.status_code == 200:
+            tracks_file_path = os.path.join(gis_path, tracks_file_name)
+            logger.info(f"Saving ZIP file to: {tracks_file_path}")
+            save_response(zip_response, tracks_file_path)
+        else:
+            logger.error(f"Failed to download ZIP file: status code {zip_response.status_code}")
+            raise Exception(f"Failed to download ZIP file: status code {zip_response.status_code}")
     t1 = time.perf_counter()
     logger.info(f"Downloaded ZIP file in {t1 - t0:.2f} seconds.")
 
@@ -303,7 +381,7 @@ def download_and_process_cyclone_data(gis_path, cyclone_seasons, country, year_s
 
     logger.info("Processing cyclone data.")
     t0 = time.perf_counter()
-    gdf = gpd.read_file(shapefile_path)
+    gdf = gpd.read_file(shapefile_path, engine=GPD_ENGINE)
     t1 = time.perf_counter()
     logger.info(f"Read shapefile in {t1 - t0:.2f} seconds.")
 
@@ -320,28 +398,25 @@ def download_and_process_cyclone_data(gis_path, cyclone_seasons, country, year_s
 
     # Define a function to filter for a specific cyclone season
     def filter_for_season(gdf, start_month, end_month, year_selected):
-        def is_within_season(row):
-            month = row["month"]
-            year = row["year"]
-            # Check if the month falls within the cyclone season period
-            if start_month <= end_month:
-                # For seasons within the same year
-                return year == year_selected and start_month <= month <= end_month
-            else:
-                # For seasons spanning two years
-                return (year == year_selected and month >= start_month) or (
-                    year == year_selected + 1 and month <= end_month
-                )
-
-        return gdf[gdf.apply(is_within_season, axis=1)]
+        year = gdf["year"]
+        month = gdf["month"]
+        # Check if the month falls within the cyclone season period
+        if start_month <= end_month:
+            # For seasons within the same year
+            mask = (year == year_selected) & (month >= start_month) & (month <= end_month)
+        else:
+            # For seasons spanning two years
+            mask = ((year == year_selected) & (month >= start_month)) | (
+                (year == year_selected + 1) & (month <= end_month)
+            )
+        return gdf[mask]
 
     # Apply cyclone season filter and create the GeoDataFrame
     logger.info("Filtering for the cyclone season.")
     t0 = time.perf_counter()
     filtered_gdf = filter_for_season(gdf, season_start_month, season_end_month, year_selected)
-    filtered_gdf["row_id"] = filtered_gdf.index + 1
-    filtered_gdf.reset_index(drop=True, inplace=True)
-    filtered_gdf.set_index("row_id", inplace=True)
+    # Label rows with their 1-based position in the source shapefile
+    filtered_gdf.index = pd.Index(filtered_gdf.index + 1, name="row_id")
 
     filtered_gdf = filtered_gdf.set_crs("EPSG:4326", allow_override=True)
 
@@ -356,14 +431,14 @@ def download_and_process_cyclone_data(gis_path, cyclone_seasons, country, year_s
     logger.info("Saving processed track to shapefile.")
     # Save the filtered shapefile
     t0 = time.perf_counter()
-    filtered_gdf.to_file(filtered_tracks_file_path)
+    filtered_gdf.to_file(filtered_tracks_file_path, engine=GPD_ENGINE)
     t1 = time.perf_counter()
     logger.info(f"Saving done in {t1 - t0:.2f} seconds.")
     return filtered_gdf
 
     # Read the filtered shapefile
     if os.path.exists(filtered_tracks_file_path):
-        read_filtered_tracks = gpd.read_file(filtered_tracks_file_path)
+        read_filtered_tracks = gpd.read_file(filtered_tracks_file_path, engine=GPD_ENGINE)
         return read_filtered_tracks
         # print(read_filtered_tracks)
     else:
@@ -416,18 +491,20 @@ def get_shapefiles_from_gis(gis_path, country):
     # Load EEZ shapefile
     eez_file = os.path.join(eez_path, f"{country}_eez.shp")
     if os.path.exists(eez_file):
-        read_eez = gpd.read_file(eez_file).set_crs("EPSG:4326", allow_override=True)
+        read_eez = gpd.read_file(eez_file, engine=GPD_ENGINE).set_crs("EPSG:4326", allow_override=True)
+        # Build the prepared EEZ union once; every point clip in the run reuses it
+        polygon_union(read_eez)
         logger.info(f"Loaded EEZ for {country}")
 
     # Load wrddsf and wrdph from root gis directory (shared across countries)
     wrddsf_file = os.path.join(gis_path, "wrddsf.shp")
     if os.path.exists(wrddsf_file):
-        wrddsf = gpd.read_file(wrddsf_file)
+        wrddsf = gpd.read_file(wrddsf_file, engine=GPD_ENGINE)
         logger.info("Loaded wrddsf")
 
     wrdph_file = os.path.join(gis_path, "wrdph.shp")
     if os.path.exists(wrdph_file):
-        wrdph = gpd.read_file(wrdph_file)
+        wrdph = gpd.read_file(wrdph_file, engine=GPD_ENGINE)
         logger.info("Loaded wrdph")
 
     # Load centroids
@@ -455,7 +532,7 @@ def get_shapefiles_from_gis(gis_path, country):
         geojson_files = [f for f in os.listdir(fishing_grounds_path) if f.endswith(".geojson")]
         if geojson_files:
             fg_file = os.path.join(fishing_grounds_path, geojson_files[0])
-            fg_df_latest = gpd.read_file(fg_file)
+            fg_df_latest = gpd.read_file(fg_file, engine=GPD_ENGINE)
             print(fg_df_latest)
             print(f"Fishing grounds loaded from: {geojson_files[0]}")
 
@@ -486,7 +563,7 @@ def read_filtered_tracks(gis_path, year_selected):
 
     filtered_tracks_file_path = os.path.join(gis_path, f"IBTrACS_{year_selected}.shp")
     if os.path.exists(filtered_tracks_file_path):
-        read_filtered_tracks = gpd.read_file(filtered_tracks_file_path)
+        read_filtered_tracks = gpd.read_file(filtered_tracks_file_path, engine=GPD_ENGINE)
         return read_filtered_tracks
     else:
         raise FileNotFoundError(f"Filtered tracks file does not exist: {filtered_tracks_file_path}")
@@ -503,21 +580,22 @@ def post_process_viirs_data(df_append, output_path):
     output_path (str): Path to save the processed data.
     """
     df_append = df_append.dropna(subset=["Date_Mscan"])
-    df_append = df_append[df_append["QF_Detect"].isin([1, 2, 3, 8, 10])]
-    df_append = df_append.drop_duplicates()
+    df_append = df_append[df_append["QF_Detect"].isin(BOAT_QF_VALUES)]
+    # A detection is identified by its scan time and position; hashing only those avoids hashing every column
+    df_append = df_append.drop_duplicates(subset=VIIRS_DETECTION_KEY)
+    # Build the point geometries straight from the coordinate arrays
     df_all_sf = gpd.GeoDataFrame(
-        df_append.set_geometry(
-            gpd.points_from_xy(df_append["Lon_DNB"], df_append["Lat_DNB"]),
-            crs="EPSG:4326",
-        )
+        df_append,
+        geometry=shapely.points(df_append["Lon_DNB"].to_numpy(), df_append["Lat_DNB"].to_numpy()),
+        crs="EPSG:4326",
     )
     df_all_sf.rename({"Date_Mscan": "ISO_TIME"}, axis=1, inplace=True)
 
     t = df_all_sf.reset_index(drop=True)
-    t["ISO_TIME"] = pd.to_datetime(t["ISO_TIME"])
-    t["date_only"] = t["ISO_TIME"].dt.date
-    t["date_only"] = pd.to_datetime(t["date_only"])
-    t.to_csv(os.path.join(output_path, "t_processed.csv"), index=False)
+    ensure_datetime(t, ["ISO_TIME"])
+    t["date_only"] = t["ISO_TIME"].dt.normalize()
+    if DEBUG_DUMP:
+        t.to_csv(os.path.join(output_path, "t_processed.csv"), index=False)
 
     return t
 
@@ -548,7 +626,7 @@ def create_lin11d(lin11, year_selected, country, cyclone_seasons):
     # logger.info(lin11)
     logger.info(f"ISO_TIME dtype before conversion: {lin11['year'].dtype}")
 
-    lin11["ISO_TIME"] = pd.to_datetime(lin11["ISO_TIME"], errors="coerce")
+    ensure_datetime(lin11, ["ISO_TIME"], errors="coerce")
     logger.info(f"ISO_TIME dtype after conversion: {lin11['ISO_TIME'].dtype}")
     logger.info(f"lin11 after datetime conversion: {lin11.head(3)}\n")
 
@@ -559,17 +637,85 @@ def create_lin11d(lin11, year_selected, country, cyclone_seasons):
         | ((lin11["year"] == end_year) & (lin11["month"] <= end_month))
     ]
 
-    lin11d["ISO_TIME"] = pd.to_datetime(lin11d["ISO_TIME"])
-
     logger.info(f"Rows after filtering: {lin11d.shape[0]}")
 
-    lin11d["date_only"] = lin11d["ISO_TIME"].dt.date
-    lin11d["date_only"] = pd.to_datetime(lin11d["date_only"])
+    # ISO_TIME is already datetime64; truncate to midnight without going through Python date objects
+    lin11d["date_only"] = lin11d["ISO_TIME"].dt.normalize()
     # logger.info(lin11d)
     logger.info(f"lin11 after datetime conversion: {lin11.head(3)}\n")
     return lin11d
 
 
+# Prepared polygon unions keyed by id() of the source geometry array; entries are dropped when the array is
+# collected. GeometryArray is unhashable, so a WeakKeyDictionary cannot hold it directly.
+_prepared_unions = {}
+
+
+def polygon_union(polygons):
+    """
+    Returns the prepared union of a GeoDataFrame's polygons, computed once per geometry array.
+
+    Parameters:
+    - polygons (GeoDataFrame): Polygons to merge (e.g. the EEZ boundary).
+
+    The cache is keyed on the identity of `polygons.geometry.values`, so row subsets and other derived frames,
+    which hold their own geometry arrays, get their own union. The union is prepared so repeated
+    point-in-polygon tests against it use the prepared index.
+    """
+    geometries = polygons.geometry.values
+    key = id(geometries)
+    cached = _prepared_unions.get(key)
+    if cached is not None and cached[0]() is geometries:
+        return cached[1]
+
+    union = shapely.union_all(geometries)
+    shapely.prepare(union)
+    _prepared_unions[key] = (weakref.ref(geometries), union)
+    weakref.finalize(geometries, _prepared_unions.pop, key, None)
+    return union
+
+
+def clip_points(points, polygons):
+    """
+    Keeps the points that intersect any of the given polygons, in their original order.
+
+    Parameters:
+    - points (GeoDataFrame): Point data to clip.
+    - polygons (GeoDataFrame): Clipping polygons (e.g. the EEZ boundary).
+
+    For all-point input this matches `gpd.clip`, whose points are returned unchanged, but tests the
+    coordinate arrays against the prepared polygon union in one vectorized call instead of building a
+    spatial index over every point. Points outside the polygons' bounding box are rejected with plain
+    array comparisons first. Other geometry types fall back to `gpd.clip`.
+    """
+    if not (points.geom_type == "Point").all():
+        return gpd.clip(points, polygons)
+
+    x = points.geometry.x.to_numpy()
+    y = points.geometry.y.to_numpy()
+    minx, miny, maxx, maxy = polygons.total_bounds
+    inside = (x >= minx) & (x <= maxx) & (y >= miny) & (y <= maxy)
+    inside[inside] = shapely.intersects_xy(polygon_union(polygons), x[inside], y[inside])
+    return points[inside]
+
+
+def ensure_datetime(df, columns, errors="raise"):
+    """
+    Converts the given columns to datetime in place, skipping columns that already hold datetimes.
+
+    Parameters:
+    - df (DataFrame): Frame whose columns are converted.
+    - columns (list): Column names to convert.
+    - errors (str): Passed to `pd.to_datetime` ("raise" or "coerce").
+
+    Most pipeline steps re-parse the same date columns defensively; this makes the repeat calls free.
+    """
+    for column in columns:
+        if df[column].dtype.kind != "M":
+            df[column] = pd.to_datetime(df[column], errors=errors)
+    return df
+
+
 # Function to post-process the IBTrACS data
 @time_execution("post-processing IBTrACS data")
 def post_process_typhoon_tracks(filtered_tracks, cyclone_seasons, year_selected, country, read_eez, output_path):
@@ -592,17 +738,17 @@ def post_process_typhoon_tracks(filtered_tracks, cyclone_seasons, year_selected,
     logger.info(f"Initial filtered_tracks shape: {filtered_tracks.shape}")
     logger.info(f"Shape after removing columns with >70% missing values: {lin11.shape}")
 
-    lin11["ISO_TIME"] = pd.to_datetime(lin11["ISO_TIME"])
+    ensure_datetime(lin11, ["ISO_TIME"])
     logger.info(f"Number of rows in lin11 after datetime conversion: {lin11.shape[0]}")
 
     lin11d = create_lin11d(lin11, year_selected, country, cyclone_seasons)
     lin11d.to_csv(os.path.join(output_path, f"lin11d_{country}_{year_selected}.csv"))
-    lin11d["date_only"] = pd.to_datetime(lin11d["date_only"])
+    ensure_datetime(lin11d, ["date_only"])
     # lin11d = convert_to_geodataframe(lin11d)
 
     logger.info(f"Number of rows in lin11d: {lin11d.shape[0]}")
 
-    lin11b = gpd.clip(lin11d, read_eez)
+    lin11b = clip_points(lin11d, read_eez)
     logger.info(f"Number of rows in lin11b: {lin11b.shape[0]}")
 
     # return lin11d, unique_dates_td, td
@@ -649,7 +795,7 @@ def process_data_for_country(country, year_selected, t, lin11d, read_eez, cyclon
     start_date = get_start_date(year_selected, start_month)
     end_year = year_selected + 1 if start_month > end_month else year_selected
 
-    df_all_b = gpd.clip(t, read_eez)
+    df_all_b = clip_points(t, read_eez)
     logger.info(f"Number of rows in df_all_b_1: {df_all_b.shape[0]}")
     df_all_b["ISO_TIME"] = pd.to_datetime(df_all_b["ISO_TIME"], utc=False)
     df_all_b["date_only"] = df_all_b["ISO_TIME"].dt.date
@@ -658,25 +804,29 @@ def process_data_for_country(country, year_selected, t, lin11d, read_eez, cyclon
         index=False,
     )
 
-    # Filtering data within the cyclone season
-    all_filtered = pd.DataFrame()
-    for year in range(year_selected, end_year + 1):
+    # Filtering data within the cyclone season, all months in one pass
+    season_months = [
+        month
+        for year in range(year_selected, end_year + 1)
         for month in range(
             start_month if year == year_selected else 1,
             end_month + 1 if year == end_year else 13,
-        ):
-            filtered_cyclone_points = filter_cyclone_points(lin11d, read_eez, month, output_path, year_selected)
-            all_filtered = pd.concat([all_filtered, filtered_cyclone_points], ignore_index=True)
+        )
+    ]
+    all_filtered = filter_cyclone_points(lin11d, read_eez, season_months, output_path, year_selected)
+    all_filtered = all_filtered.reset_index(drop=True)
 
     # Save to intermediate output directory
-    all_filtered.to_csv(os.path.join(output_path, f"all_filtered_{year_selected}.csv"), index=False)
+    if DEBUG_DUMP:
+        all_filtered.to_csv(os.path.join(output_path, f"all_filtered_{year_selected}.csv"), index=False)
 
     td = df_all_b[df_all_b["date_only"] >= start_date]
 
     if "date_only" not in td.columns:
         td["date_only"] = td["ISO_TIME"].dt.date
 
-    td.to_csv(os.path.join(output_path, f"td_{country}_{year_selected}.csv"), index=False)
+    if DEBUG_DUMP:
+        td.to_csv(os.path.join(output_path, f"td_{country}_{year_selected}.csv"), index=False)
     logger.info(f"Number of rows in td: {td.shape[0]}")
 
     # Get unique dates in the 'date_only' column of td
@@ -699,11 +849,18 @@ def post_process_boats_and_typhoons(lin11d, td, read_eez, year_selected, country
     # Clip the data using the bounding box
     # logger.info(lin11d)
     logger.info(f"Number of rows in lin11d: {lin11d.shape[0]}")
-    lin11d_clipped = lin11d[lin11d.intersects(bbox_geom2)]
-    lin11d_clipped.to_csv(os.path.join(output_path, f"lin1dd_clipped_{country}_{year_selected}.csv"))
+    if (lin11d.geom_type == "Point").all():
+        # Track points: compare the coordinate arrays with the box edges instead of running a GEOS predicate
+        x = lin11d.geometry.x.to_numpy()
+        y = lin11d.geometry.y.to_numpy()
+        lin11d_clipped = lin11d[(x >= bbox2[0]) & (x <= bbox2[2]) & (y >= bbox2[1]) & (y <= bbox2[3])]
+    else:
+        lin11d_clipped = lin11d[lin11d.intersects(bbox_geom2)]
+    if DEBUG_DUMP:
+        lin11d_clipped.to_csv(os.path.join(output_path, f"lin1dd_clipped_{country}_{year_selected}.csv"))
     logger.info(f"Number of rows in lin11d_clipped: {lin11d_clipped.shape[0]}")
 
-    lin11d_clipped["ISO_TIME"] = pd.to_datetime(lin11d_clipped["ISO_TIME"], errors="coerce")
+    ensure_datetime(lin11d_clipped, ["ISO_TIME"], errors="coerce")
 
     # Ensure 'date_only' column exists and is in datetime format
     if "date_only" not in lin11d_clipped.columns:
@@ -712,44 +869,41 @@ def post_process_boats_and_typhoons(lin11d, td, read_eez, year_selected, country
         # Convert 'date_only' to datetime format if it already exists
         lin11d_clipped["date_only"] = pd.to_datetime(lin11d_clipped["date_only"], errors="coerce").dt.date
 
-    # lin11d_clipped["ISO_TIME"] = pd.to_datetime(lin11d_clipped["date_only"]).dt.date
-    unique_dates = lin11d_clipped["date_only"].astype(str).unique()
-    logger.info(f"Number of rows in unique_dates: {unique_dates.shape[0]}")
-    # Getting the clipped boats without typhoon experience
-    print(td.head())
-    td["date_only"] = pd.to_datetime(td["date_only"]).dt.date
-
-    unique_dates = pd.to_datetime(unique_dates).date
+    # Compare days as datetime64[D] so the membership test hashes integers rather than date objects
+    unique_dates = pd.unique(pd.to_datetime(lin11d_clipped["date_only"]).to_numpy().astype("datetime64[D]"))
     logger.info(f"Number of rows in unique_dates: {len(unique_dates)}")
+    print(td.head())
+    typhoon_day = np.isin(pd.to_datetime(td["date_only"]).to_numpy().astype("datetime64[D]"), unique_dates)
 
-    boats_no_typhoons = td[~td["date_only"].isin(unique_dates)]
-    boats_no_typhoons.to_csv(os.path.join(output_path, f"{country}_{year_selected}_boats_no_ty.csv"))
+    # Getting the clipped boats without typhoon experience
+    boats_no_typhoons = td[~typhoon_day]
+    if DEBUG_DUMP:
+        boats_no_typhoons.to_csv(os.path.join(output_path, f"{country}_{year_selected}_boats_no_ty.csv"))
 
     # Getting the clipped boats with typhoon experience
-    boats_typhoons = td[td["date_only"].isin(unique_dates)]
-    boats_typhoons.to_csv(os.path.join(output_path, f"{country}_{year_selected}_boats_ty.csv"))
+    boats_typhoons = td[typhoon_day]
+    if DEBUG_DUMP:
+        boats_typhoons.to_csv(os.path.join(output_path, f"{country}_{year_selected}_boats_ty.csv"))
 
     logger.info(f"Number of boats without typhoon occurrence: {boats_no_typhoons.shape[0]}")
     logger.info(f"Number of boats with typhoon occurrence: {boats_typhoons.shape[0]}")
 
     # Generating statistics of monthly number of boats with and without typhoon experience
-    boats_no_typhoons["date_only"] = pd.to_datetime(boats_no_typhoons["date_only"])
+    ensure_datetime(boats_no_typhoons, ["date_only"])
     boats_per_month = boats_no_typhoons.groupby(boats_no_typhoons["date_only"].dt.to_period("M")).size().reset_index()
     boats_per_month.columns = ["Month", "Boats_Count_No_ty"]
     boats_per_month.to_csv(os.path.join(output_path, f"{country}_{year_selected}_sum_boats_no_ty.csv"))
 
-    boats_typhoons["date_only"] = pd.to_datetime(boats_typhoons["date_only"])
+    ensure_datetime(boats_typhoons, ["date_only"])
     boats_ty_per_month = boats_typhoons.groupby(boats_typhoons["date_only"].dt.to_period("M")).size().reset_index()
     boats_ty_per_month.columns = ["Month", "Boats_Count_With_ty"]
     boats_ty_per_month.to_csv(os.path.join(output_path, f"{country}_{year_selected}_sum_boats_with_ty.csv"))
 
-    # Count of boats per dateonly (no_typhoons happened)
-    boats_per_date = boats_no_typhoons["date_only"].value_counts().reset_index()
-    boats_per_date.columns = ["date_only", "count"]
+    # Count of boats per dateonly (no_typhoons happened), in date order; reused by the later steps
+    boats_per_date = boats_no_typhoons.groupby("date_only", sort=True).size().reset_index(name="count")
 
     # Count of boats per dateonly (typhoons happened)
-    boats_per_date_ty = boats_typhoons["date_only"].value_counts().reset_index()
-    boats_per_date_ty.columns = ["date_only", "count"]
+    boats_per_date_ty = boats_typhoons.groupby("date_only", sort=True).size().reset_index(name="count")
 
     return (
         lin11d_clipped,
@@ -762,6 +916,77 @@ def post_process_boats_and_typhoons(lin11d, td, read_eez, year_selected, country
     )
 
 
+def binned_kde(x_coords, y_coords, gridsize=100):
+    """
+    Evaluates a Gaussian kernel density estimate of 2D points on a regular grid spanning the points.
+
+    Parameters:
+    - x_coords (ndarray): X coordinates of the points (e.g. longitudes).
+    - y_coords (ndarray): Y coordinates of the points (e.g. latitudes).
+    - gridsize (int): Number of grid nodes along each axis.
+
+    Returns:
+    - x_grid, y_grid, density (ndarray): Grid node coordinates and density, laid out like `np.mgrid`.
+
+    Uses the same kernel as `scipy.stats.gaussian_kde` (Scott's rule, full data covariance), but spreads
+    the points onto the grid with linear binning and convolves the counts with the kernel by FFT, so the
+    cost no longer grows with points x grid nodes.
+    """
+    x_min, x_max = x_coords.min(), x_coords.max()
+    y_min, y_max = y_coords.min(), y_coords.max()
+    x_grid, y_grid = np.mgrid[x_min : x_max : gridsize * 1j, y_min : y_max : gridsize * 1j]
+    dx = (x_max - x_min) / (gridsize - 1)
+    dy = (y_max - y_min) / (gridsize - 1)
+
+    def spread(values, low, step):
+        position = (values - low) / step
+        lower = np.clip(np.floor(position).astype(np.intp), 0, gridsize - 2)
+        return lower, position - lower
+
+    # Linear binning: each point is shared between the four surrounding grid nodes
+    xi, xw = spread(x_coords, x_min, dx)
+    yi, yw = spread(y_coords, y_min, dy)
+    counts = np.zeros(gridsize * gridsize)
+    for di, wx in ((0, 1 - xw), (1, xw)):
+        for dj, wy in ((0, 1 - yw), (1, yw)):
+            counts += np.bincount((xi + di) * gridsize + yi + dj, weights=wx * wy, minlength=gridsize * gridsize)
+    counts = counts.reshape(gridsize, gridsize)
+
+    # Gaussian kernel with Scott's bandwidth (n ** (-1/6) per axis in 2D), evaluated at every grid offset
+    n = x_coords.size
+    cov = np.cov(x_coords, y_coords) * n ** (-1 / 3)
+    inv = np.linalg.inv(cov)
+    offset_x, offset_y = np.meshgrid(
+        np.arange(1 - gridsize, gridsize) * dx, np.arange(1 - gridsize, gridsize) * dy, indexing="ij"
+    )
+    kernel = np.exp(-0.5 * (inv[0, 0] * offset_x**2 + 2 * inv[0, 1] * offset_x * offset_y + inv[1, 1] * offset_y**2))
+    kernel /= 2 * np.pi * np.sqrt(np.linalg.det(cov)) * n
+
+    # FFT round-off can leave tiny negative densities far from the points
+    density = np.clip(signal.fftconvolve(counts, kernel, mode="same"), 0, None)
+    return x_grid, y_grid, density
+
+
+def merge_contour_polygons(polygons):
+    """
+    Merges overlapping contour polygons into connected fishing grounds.
+
+    Parameters:
+    - polygons (list): Valid contour polygons, in contour order.
+
+    Returns:
+    - merged_polygons (ndarray): One polygon per ground, ordered by the first contour polygon it contains.
+
+    Uses one cascaded union instead of pairwise intersects/union calls. Grounds are numbered in the order of
+    their first contour polygon, as the previous pairwise merge loop did.
+    """
+    merged_polygons = shapely.get_parts(shapely.union_all(polygons))
+    part_index, polygon_index = shapely.STRtree(polygons).query(merged_polygons, predicate="intersects")
+    first_polygon = np.full(len(merged_polygons), len(polygons))
+    np.minimum.at(first_polygon, part_index, polygon_index)
+    return merged_polygons[np.argsort(first_polygon, kind="stable")]
+
+
 # Function to determine fishing grounds
 @time_execution("determining fishing grounds")
 def determine_fishing_grounds(boats_no_typhoons, year_selected, country, fg_df_latest, output_path):
@@ -792,20 +1017,8 @@ def determine_fishing_grounds(boats_no_typhoons, year_selected, country, fg_df_l
         merged_gdf = fg_df_latest
         logger.info("Using 'grounds_latest.geojson' for current year clipping.")
     else:
-        # Perform kernel density estimation
-        kde = stats.gaussian_kde([x_coords, y_coords])
-
-        # Define the grid over which to evaluate the KDE
-        x_grid, y_grid = np.mgrid[
-            x_coords.min() : x_coords.max() : 100j,
-            y_coords.min() : y_coords.max() : 100j,
-        ]
-
-        # Evaluate the KDE on the grid
-        kde_values = kde(np.vstack([x_grid.ravel(), y_grid.ravel()]))
-
-        # Reshape the KDE values back to the grid shape
-        kde_values = kde_values.reshape(x_grid.shape)
+        # Perform kernel density estimation on a 100 x 100 grid over the boat locations
+        x_grid, y_grid, kde_values = binned_kde(x_coords, y_coords)
 
         # Set the density threshold to identify highest density points -> main fishing grounds, contour form, using 50% threshold
         density_threshold = np.percentile(kde_values, 90)
@@ -844,38 +1057,10 @@ def determine_fishing_grounds(boats_no_typhoons, year_selected, country, fg_df_l
         logger.info(f"Number of fishing grounds: {len(valid_polygons)}")
         update_last_run_num_grounds(len(valid_polygons))
 
-        # Create a GeoDataFrame from valid polygons
-        shapely_polygons = [shape(p) for p in valid_polygons]
-        merged_features = []
-        merged_dict = {i: False for i in range(len(shapely_polygons))}  # Track merged polygons
-        contour_id = 0  # Initialize contour ID
-
-        i = 0
-        while i < len(shapely_polygons):
-            if merged_dict[i]:
-                i += 1
-                continue
-
-            current_polygon = shapely_polygons[i]
-            j = i + 1
-            while j < len(shapely_polygons):
-                if merged_dict[j]:
-                    j += 1
-                    continue
-
-                if current_polygon.intersects(shapely_polygons[j]):
-                    try:
-                        current_polygon = current_polygon.union(shapely_polygons[j])
-                        merged_dict[j] = True
-                    except TopologicalError as e:
-                        print(f"Error merging polygons {i} and {j}: {e}")
-                j += 1
-
-            # Add merged or individual polygon to features with contour ID
-            merged_features.append(geojson.Feature(geometry=current_polygon, properties={"contour_id": contour_id}))
-            merged_dict[i] = True
-            contour_id += 1
-            i += 1
+        merged_features = [
+            geojson.Feature(geometry=polygon, properties={"contour_id": contour_id})
+            for contour_id, polygon in enumerate(merge_contour_polygons(valid_polygons))
+        ]
 
         # Create a GeoDataFrame from the merged features
         merged_gdf = gpd.GeoDataFrame.from_features(merged_features, crs="EPSG:4326")
@@ -883,13 +1068,13 @@ def determine_fishing_grounds(boats_no_typhoons, year_selected, country, fg_df_l
 
         # Output the merged polygons as a GeoJSON file
         merged_geojson_file = os.path.join(output_path, f"{country}_merged_dense_area_polygons_{year_selected}.geojson")
-        merged_gdf.to_file(merged_geojson_file, driver="GeoJSON")
+        merged_gdf.to_file(merged_geojson_file, driver="GeoJSON", engine=GPD_ENGINE)
         print(f"Merged polygons GeoJSON saved as '{merged_geojson_file}'")
 
     # Create a GeoDataFrame for the original DataFrame
     original_gdf = gpd.GeoDataFrame(
         boats_no_typhoons,
-        geometry=gpd.points_from_xy(boats_no_typhoons["Lon_DNB"], boats_no_typhoons["Lat_DNB"]),
+        geometry=shapely.points(boats_no_typhoons["Lon_DNB"].to_numpy(), boats_no_typhoons["Lat_DNB"].to_numpy()),
         crs="EPSG:4326",
     )
 
@@ -902,8 +1087,7 @@ def determine_fishing_grounds(boats_no_typhoons, year_selected, country, fg_df_l
     print(f"Clipped data saved as '{clipped_csv_file}'")
 
     # Create GeoDataFrame for the scatter points
-    gdf_scatter = gpd.GeoDataFrame(geometry=[Point(x, y) for x, y in zip(x_coords, y_coords, strict=False)])
-    gdf_scatter.set_crs(epsg=4326, inplace=True)
+    gdf_scatter = gpd.GeoDataFrame(geometry=shapely.points(x_coords, y_coords), crs="EPSG:4326")
 
     # Simulate GeoDataFrame for clipped_gdf
     clipped_gdf.set_crs(epsg=4326, inplace=True)
@@ -1000,14 +1184,15 @@ def determine_fishing_grounds(boats_no_typhoons, year_selected, country, fg_df_l
 # Function to clip boats with typhoon occurrence using the main fishing grounds
 @time_execution("clipping boats with typhoon occurrence")
 def clip_boats_with_typhoon_occurrence(
-    boats_typhoons, boats_no_typhoons, merged_gdf, year_selected, country, output_path
+    boats_typhoons, boats_per_date_ty, boats_per_date, merged_gdf, year_selected, country, output_path
 ):
     """
     Clips fishing boat locations that experienced typhoon events to the main fishing grounds and computes boat counts for each typhoon occurrence date.
 
     Parameters:
     - boats_typhoons (DataFrame): Data containing fishing boat locations with typhoon occurrences.
-    - boats_no_typhoons (DataFrame): Data of fishing boats without typhoon occurrences.
+    - boats_per_date_ty (DataFrame): Number of boats per date with typhoon occurrence, in date order.
+    - boats_per_date (DataFrame): Number of boats per date without typhoon occurrence, in date order.
     - merged_gdf (GeoDataFrame): Main fishing grounds defined by KDE-derived contours.
     - year_selected (int): Year of data analysis.
     - country (str): Country code used for naming outputs.
@@ -1019,7 +1204,7 @@ def clip_boats_with_typhoon_occurrence(
     # Create a GeoDataFrame for the original DataFrame: Boats with typhoon experience
     typhoons_gdf = gpd.GeoDataFrame(
         boats_typhoons,
-        geometry=gpd.points_from_xy(boats_typhoons["Lon_DNB"], boats_typhoons["Lat_DNB"]),
+        geometry=shapely.points(boats_typhoons["Lon_DNB"].to_numpy(), boats_typhoons["Lat_DNB"].to_numpy()),
         crs="EPSG:4326",
     )
 
@@ -1027,14 +1212,13 @@ def clip_boats_with_typhoon_occurrence(
     clipped_ty_gdf = gpd.sjoin(typhoons_gdf, merged_gdf, predicate="within")
 
     # Save the clipped data as a new CSV file -> clipped boats typhoon with contour id
-    clipped_ty_gdf.to_csv(
-        os.path.join(output_path, f"clipped_ty_gdf_{country}_{year_selected}.csv"),
-        index=False,
-    )
+    if DEBUG_DUMP:
+        clipped_ty_gdf.to_csv(
+            os.path.join(output_path, f"clipped_ty_gdf_{country}_{year_selected}.csv"),
+            index=False,
+        )
     # Calculate the total number of boats during typhoon occurrence (per date)
-    boats_fishing_grounds = boats_typhoons["date_only"].value_counts().reset_index()
-    boats_fishing_grounds.columns = ["date_only", "boats_fishing"]
-    boats_fishing_grounds = boats_fishing_grounds.sort_values(by="date_only")
+    boats_fishing_grounds = boats_per_date_ty.rename(columns={"count": "boats_fishing"})
     boats_fishing_grounds.to_csv(
         os.path.join(output_path, f"boats_fishing_grounds_{country}_{year_selected}.csv"),
         index=False,
@@ -1052,9 +1236,7 @@ def clip_boats_with_typhoon_occurrence(
     )
 
     # Calculate the total number of boats without typhoon occurrence (per date)
-    boats_fishing_grounds_noty = boats_no_typhoons["date_only"].value_counts().reset_index()
-    boats_fishing_grounds_noty.columns = ["date_only", "boats_fishing"]
-    boats_fishing_grounds_noty = boats_fishing_grounds_noty.sort_values(by="date_only")
+    boats_fishing_grounds_noty = boats_per_date.rename(columns={"count": "boats_fishing"})
     boats_fishing_grounds_noty.to_csv(
         os.path.join(output_path, f"boats_fishing_grounds_noty_{country}_{year_selected}.csv"),
         index=False,
@@ -1104,18 +1286,18 @@ def compute_clipped_boats(
     """
 
     # Convert the 'date' column to a datetime object
-    clipped_ty_gdf["date_only"] = pd.to_datetime(clipped_ty_gdf["date_only"])
+    ensure_datetime(clipped_ty_gdf, ["date_only"])
 
-    # Extract the date only from the datetime column
-    clipped_ty_gdf["date_only"] = clipped_ty_gdf["date_only"].dt.date
+    # Truncate to the day, keeping the datetime dtype
+    clipped_ty_gdf["date_only"] = clipped_ty_gdf["date_only"].dt.normalize()
 
     # Group by 'contour_id' and 'date_only', and then count rows in each group
     grouped_counts = clipped_ty_gdf.groupby(["contour_id", "date_only"]).size().reset_index(name="row_count")
 
-    grouped_counts["date_only"] = pd.to_datetime(grouped_counts["date_only"])
+    ensure_datetime(grouped_counts, ["date_only"])
 
     # Convert 'date_only' column in boats_fishing_grounds to datetime
-    boats_fishing_grounds["date_only"] = pd.to_datetime(boats_fishing_grounds["date_only"])
+    ensure_datetime(boats_fishing_grounds, ["date_only"])
 
     # Merge the grouped counts with boats_fishing_grounds
     grouped_counts = pd.merge(
@@ -1150,13 +1332,13 @@ def compute_clipped_boats(
 
 
 @time_execution("computing clipped boats without typhoon")
-def compute_clipped_boats_no_typhoon(clipped_gdf, boats_no_typhoons, year_selected, country, output_path):
+def compute_clipped_boats_no_typhoon(clipped_gdf, boats_per_date, year_selected, country, output_path):
     """
     Compute the number of clipped boats per fishing ground without typhoon occurrence, and the total number of boats per date of typhoon occurrence.
 
     Parameters:
     - clipped_gdf: GeoDataFrame containing boats without typhoon occurrence.
-    - boats_no_typhoons: DataFrame containing the number of boats per date without typhoon occurrence.
+    - boats_per_date: DataFrame containing the number of boats per date without typhoon occurrence.
     - year_selected: The selected year for the analysis.
     - country: The country code for the analysis.
 
@@ -1165,24 +1347,22 @@ def compute_clipped_boats_no_typhoon(clipped_gdf, boats_no_typhoons, year_select
     """
 
     # Convert the 'date' column to a datetime object
-    clipped_gdf["date_only"] = pd.to_datetime(clipped_gdf["date_only"])
+    ensure_datetime(clipped_gdf, ["date_only"])
 
-    # Extract the date only from the datetime column
-    clipped_gdf["date_only"] = clipped_gdf["date_only"].dt.date
+    # Truncate to the day, keeping the datetime dtype
+    clipped_gdf["date_only"] = clipped_gdf["date_only"].dt.normalize()
 
     # Group by 'contour_id' and 'date_only', and then count rows in each group
     grouped_counts2 = clipped_gdf.groupby(["contour_id", "date_only"]).size().reset_index(name="row_count")
 
     # Convert 'date_only' column in grouped_counts2 to datetime
-    grouped_counts2["date_only"] = pd.to_datetime(grouped_counts2["date_only"])
+    ensure_datetime(grouped_counts2, ["date_only"])
 
     # Calculate the total number of boats without typhoon occurrence (per date)
-    boats_fishing_grounds_no_ty = boats_no_typhoons["date_only"].value_counts().reset_index()
-    boats_fishing_grounds_no_ty.columns = ["date_only", "boats_fishing"]
-    boats_fishing_grounds_no_ty = boats_fishing_grounds_no_ty.sort_values(by="date_only")
+    boats_fishing_grounds_no_ty = boats_per_date.rename(columns={"count": "boats_fishing"})
 
     # Convert 'date_only' column in boats_fishing_grounds_no_ty to datetime
-    boats_fishing_grounds_no_ty["date_only"] = pd.to_datetime(boats_fishing_grounds_no_ty["date_only"])
+    ensure_datetime(boats_fishing_grounds_no_ty, ["date_only"])
 
     # Merge the grouped counts with boats_fishing_grounds_no_ty
     grouped_counts2 = pd.merge(
@@ -1244,19 +1424,20 @@ def calculate_centroids(merged_gdf, output_path, country, year_selected):
 
     read_poly = merged_gdf.copy()
 
-    # Function to compute centroids for Polygon or MultiPolygon geometries
-    def compute_centroid(geom):
-        if geom.geom_type == "Polygon":
-            return geom.centroid
-        elif geom.geom_type == "MultiPolygon":
-            return geom.representative_point()  # Use a representative point for MultiPolygon
-        else:
-            raise ValueError(f"Unsupported geometry type: {geom.geom_type}")
-
-    # Calculate the centroid for each geometry
-    read_poly["centroid"] = read_poly.geometry.apply(compute_centroid)
-    read_poly["lat"] = read_poly["centroid"].y
-    read_poly["lon"] = read_poly["centroid"].x
+    # Only Polygon and MultiPolygon geometries are supported
+    geometries = read_poly.geometry.to_numpy()
+    type_ids = shapely.get_type_id(geometries)
+    unsupported = ~np.isin(type_ids, [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON])
+    if unsupported.any():
+        raise ValueError(f"Unsupported geometry type: {getattr(geometries[unsupported][0], 'geom_type', None)}")
+
+    # Calculate the centroid for each geometry; a MultiPolygon gets a representative point instead
+    centroids = shapely.centroid(geometries)
+    is_multi = type_ids == shapely.GeometryType.MULTIPOLYGON
+    centroids[is_multi] = shapely.point_on_surface(geometries[is_multi])
+    read_poly["centroid"] = gpd.GeoSeries(centroids, index=read_poly.index, crs=read_poly.crs)
+    read_poly["lat"] = shapely.get_y(centroids)
+    read_poly["lon"] = shapely.get_x(centroids)
 
     # Save to CSV
     read_poly.to_csv(os.path.join(output_path, f"centers_{country}_{year_selected}.csv"), index=False)
@@ -1264,49 +1445,53 @@ def calculate_centroids(merged_gdf, output_path, country, year_selected):
 
 
 @time_execution("filtering cyclone points")
-def filter_cyclone_points(lin11d, read_eez, month, output_path=None, year_selected=None):
+def filter_cyclone_points(lin11d, read_eez, months, output_path=None, year_selected=None):
     """
     Filter cyclone points that are within the EEZ and meet the criteria of being present for at least one day.
 
     Parameters:
     - lin11d: DataFrame containing cyclone points.
     - read_eez: GeoDataFrame containing the EEZ boundaries.
-    - month: Integer representing the month for which to filter cyclone points.
+    - months: Months, in season order, for which to filter cyclone points. Each month is evaluated on its own.
     - output_path: Optional path for saving debug files.
     - year_selected: Optional year for naming debug files.
 
     Returns:
-    - filtered_points: DataFrame containing filtered cyclone points.
+    - filtered_points: DataFrame containing filtered cyclone points, grouped by month in the order given.
     """
 
-    lin11d["ISO_TIME"] = pd.to_datetime(lin11d["ISO_TIME"], errors="coerce")
-    lin11d["date_only"] = lin11d["ISO_TIME"].dt.date
-    lin11d["date_only"] = pd.to_datetime(lin11d["date_only"])
+    ensure_datetime(lin11d, ["ISO_TIME"], errors="coerce")
+    lin11d["date_only"] = lin11d["ISO_TIME"].dt.normalize()
     lin11d["month"] = pd.to_numeric(lin11d["month"], errors="coerce", downcast="integer")
 
     # cyclone_points_month_df = lin11d[lin11d['date_only'].dt.month == month]
-    cyclone_points_month_df = lin11d[lin11d["month"] == month]
-
-    # Identify cyclone names that have points within the EEZ
-    cyclone_names_inside_eez = set()
-    for _, cyclone_point in cyclone_points_month_df.iterrows():
-        cyclone_name = cyclone_point["NAME"]
-        if any(read_eez.geometry.contains(cyclone_point.geometry)):
-            cyclone_names_inside_eez.add(cyclone_name)
+    month_order = {month: position for position, month in enumerate(months)}
+    cyclone_points_month_df = lin11d[lin11d["month"].isin(month_order)]
+    cyclone_points_month_df = cyclone_points_month_df.iloc[
+        np.argsort(cyclone_points_month_df["month"].map(month_order).to_numpy(), kind="stable")
+    ]
 
-    cyclones_inside_eez = cyclone_points_month_df[cyclone_points_month_df["NAME"].isin(cyclone_names_inside_eez)]
+    # Spatial join all season points once, then work per (month, cyclone). Only the EEZ geometry is joined;
+    # its attribute columns are not needed here.
+    points_inside_eez = gpd.sjoin(cyclone_points_month_df, read_eez[["geometry"]], predicate="within", how="inner")
 
-    points_inside_eez = gpd.sjoin(cyclones_inside_eez, read_eez, predicate="within", how="inner")
+    # Keep the cyclones that have points within the EEZ in that month
+    month_name_keys = ["month", "NAME"]
+    inside_keys = pd.MultiIndex.from_frame(points_inside_eez[month_name_keys])
+    cyclones_inside_eez = cyclone_points_month_df[
+        pd.MultiIndex.from_frame(cyclone_points_month_df[month_name_keys]).isin(inside_keys)
+    ]
 
     # Calculate entry and exit dates within the EEZ
-    points_inside_eez["entered_eez_date"] = points_inside_eez.groupby("NAME")["date_only"].transform("min")
-    points_inside_eez["within_eez_date"] = points_inside_eez.groupby("NAME")["date_only"].transform("max")
+    dates_inside_eez = points_inside_eez.groupby(month_name_keys)["date_only"]
+    points_inside_eez["entered_eez_date"] = dates_inside_eez.transform("min")
+    points_inside_eez["within_eez_date"] = dates_inside_eez.transform("max")
 
     # New criteria (a) = minimum of 1 day inside EEZ
     # Merge the processed dates back to cyclones_inside_eez
     cyclones_inside_eez2 = cyclones_inside_eez.merge(
-        points_inside_eez[["NAME", "entered_eez_date", "within_eez_date"]],
-        on="NAME",
+        points_inside_eez[month_name_keys + ["entered_eez_date", "within_eez_date"]],
+        on=month_name_keys,
         how="left",
     )
     cyclones_inside_eez2["days_inside_eez"] = (
@@ -1316,7 +1501,7 @@ def filter_cyclone_points(lin11d, read_eez, month, output_path=None, year_select
     # Exclude cyclone points within EEZ for less than 1 day
     filtered_points = cyclones_inside_eez2[cyclones_inside_eez2["days_inside_eez"] >= 1]
     # Save to intermediate output directory (optional, for debugging)
-    if output_path and year_selected:
+    if DEBUG_DUMP and output_path and year_selected:
         filtered_points.to_csv(os.path.join(output_path, f"filtered_{year_selected}.csv"), index=False)
 
     return filtered_points
@@ -1335,28 +1520,30 @@ def prepare_storm_speed_data(all_filtered, clipped_ty_gdf, output_path, country,
     - test_stmspeed: DataFrame combining filtered cyclones and boats within the typhoon period.
     """
     # Convert date columns to datetime format
-    all_filtered["date_only"] = pd.to_datetime(all_filtered["date_only"])
-    clipped_ty_gdf["date_only"] = pd.to_datetime(clipped_ty_gdf["date_only"])
+    ensure_datetime(all_filtered, ["date_only"])
+    ensure_datetime(clipped_ty_gdf, ["date_only"])
 
     # Combine the filtered cyclones and the boats within the typhoon period
     test_stmspeed = pd.merge(all_filtered, clipped_ty_gdf, on="date_only")
     logger.info(test_stmspeed.head(3))
 
-    full_merge = pd.merge(all_filtered, clipped_ty_gdf, on="date_only", how="outer", indicator=True)
+    # Rows of all_filtered whose date has no boats in clipped_ty_gdf; a membership test instead of an outer merge
+    unmatched_mask = ~all_filtered["date_only"].isin(clipped_ty_gdf["date_only"].unique())
 
     # Initialize unmatched_rows as None for flexibility
     unmatched_rows = None
 
     # Check if there are unmatched rows
-    if "left_only" in full_merge["_merge"].unique():
+    if unmatched_mask.any():
         # Filter rows that are only in all_filtered (not matched with clipped_ty_gdf)
-        unmatched_rows = full_merge[full_merge["_merge"] == "left_only"].drop(columns=["_merge"])
+        unmatched_rows = all_filtered[unmatched_mask]
         logger.info("Unmatched rows found:")
         # Save unmatched rows dataframe
-        unmatched_rows.to_csv(
-            os.path.join(output_path, f"unmatched_rows_{country}_{year_selected}.csv"),
-            index=False,
-        )
+        if DEBUG_DUMP:
+            unmatched_rows.to_csv(
+                os.path.join(output_path, f"unmatched_rows_{country}_{year_selected}.csv"),
+                index=False,
+            )
     else:
         logger.info("No unmatched rows found.")
 
@@ -1379,8 +1566,8 @@ def calculate_storm_speed(all_filtered, clipped_ty_gdf, unmatched_rows, output_p
     and monthly maximum storm speeds.
     """
 
-    all_filtered["date_only"] = pd.to_datetime(all_filtered["date_only"])
-    clipped_ty_gdf["date_only"] = pd.to_datetime(clipped_ty_gdf["date_only"])
+    ensure_datetime(all_filtered, ["date_only"])
+    ensure_datetime(clipped_ty_gdf, ["date_only"])
 
     test_stmspeed = pd.merge(all_filtered, clipped_ty_gdf, on="date_only")
 
@@ -1394,16 +1581,16 @@ def calculate_storm_speed(all_filtered, clipped_ty_gdf, unmatched_rows, output_p
         storm_spd_mean_df0.columns = ["date_only", "NAME", "stm_spd_mean"]
 
         # Ensure 'date_only' remains a datetime object
-        storm_spd_mean_df0["date_only"] = pd.to_datetime(storm_spd_mean_df0["date_only"]).dt.date
-        storm_spd_mean_df0["date_only"] = pd.to_datetime(storm_spd_mean_df0["date_only"])
+        ensure_datetime(storm_spd_mean_df0, ["date_only"])
+        storm_spd_mean_df0["date_only"] = storm_spd_mean_df0["date_only"].dt.normalize()
 
         storm_spd_mean00 = unmatched_rows.groupby(["date_only", "NAME"])["STORM_SPD"].mean().round(1)
         storm_spd_mean_df00 = storm_spd_mean00.reset_index()
         storm_spd_mean_df00.columns = ["date_only", "NAME", "stm_spd_mean"]
 
         # Ensure 'date_only' remains a datetime object
-        storm_spd_mean_df00["date_only"] = pd.to_datetime(storm_spd_mean_df00["date_only"]).dt.date
-        storm_spd_mean_df00["date_only"] = pd.to_datetime(storm_spd_mean_df00["date_only"])
+        ensure_datetime(storm_spd_mean_df00, ["date_only"])
+        storm_spd_mean_df00["date_only"] = storm_spd_mean_df00["date_only"].dt.normalize()
 
         # Find the maximum storm speed for each month
         result0 = storm_spd_mean_df0.groupby(storm_spd_mean_df0["date_only"].dt.to_period("M")).apply(
@@ -1473,10 +1660,10 @@ def calculate_min_distance(
     """
 
     # Convert date columns to datetime format
-    storm_spd_mean_df0["date_only"] = pd.to_datetime(storm_spd_mean_df0["date_only"])
-    storm_spd_mean_df00["date_only"] = pd.to_datetime(storm_spd_mean_df00["date_only"])
-    lin11d["date_only"] = pd.to_datetime(lin11d["date_only"])
-    clipped_ty_gdf["date_only"] = pd.to_datetime(clipped_ty_gdf["date_only"])
+    ensure_datetime(storm_spd_mean_df0, ["date_only"])
+    ensure_datetime(storm_spd_mean_df00, ["date_only"])
+    ensure_datetime(lin11d, ["date_only"])
+    ensure_datetime(clipped_ty_gdf, ["date_only"])
 
     # Determine the DataFrame to use based on the year
     current_year = pd.Timestamp.now().year
@@ -1572,25 +1759,25 @@ def finalize_data_for_ingestion(
 
     # Convert date columns to datetime format
     # logger.info(test_stmspeed)
-    test_stmspeed["date_only"] = pd.to_datetime(test_stmspeed["date_only"])
-    storm_spd_mean_df0["date_only"] = pd.to_datetime(storm_spd_mean_df0["date_only"])
+    ensure_datetime(test_stmspeed, ["date_only"])
+    ensure_datetime(storm_spd_mean_df0, ["date_only"])
 
     def process_data(storm_spd_mean_df, pivot_table3_current, test_stmspeed_local):
         # Check if test_stmspeed_local and the current storm speed DataFrame are not empty
         if not test_stmspeed_local.empty and not storm_spd_mean_df.empty:
             # Convert date columns to datetime format
             print("last step")
-            test_stmspeed_local["date_only"] = pd.to_datetime(test_stmspeed_local["date_only"])
+            ensure_datetime(test_stmspeed_local, ["date_only"])
             print(test_stmspeed_local["date_only"].unique())
-            storm_spd_mean_df["date_only"] = pd.to_datetime(storm_spd_mean_df["date_only"])
+            ensure_datetime(storm_spd_mean_df, ["date_only"])
             print(storm_spd_mean_df["date_only"].unique())
-            pivot_table3_current["date_only"] = pd.to_datetime(pivot_table3_current["date_only"])
+            ensure_datetime(pivot_table3_current, ["date_only"])
             print(pivot_table3_current["date_only"].unique())
 
             # Calculating the max storm speed per date
             storm_spd_max = test_stmspeed_local.groupby(["date_only", "NAME"])["STORM_SPD"].max().reset_index()
             storm_spd_max.columns = ["date_only", "NAME", "stm_spd_max"]
-            storm_spd_max["date_only"] = pd.to_datetime(storm_spd_max["date_only"])
+            ensure_datetime(storm_spd_max, ["date_only"])
 
             # Merge with storm_spd_mean_df on both 'date_only' and 'NAME' to retain the storm name
             storm_spd_max = pd.merge(storm_spd_max, storm_spd_mean_df, on=["date_only", "NAME"])
@@ -2203,7 +2390,8 @@ def main(config: Config, overwrite: bool, debug: bool = False, read_from_file=Fa
         merge_boats_num,
     ) = clip_boats_with_typhoon_occurrence(
         boats_typhoons,
-        boats_no_typhoons,
+        boats_per_date_ty,
+        boats_per_date,
         merged_gdf,
         year_selected,
         country,
@@ -2228,7 +2416,7 @@ def main(config: Config, overwrite: bool, debug: bool = False, read_from_file=Fa
     update_progress(3, "Analyzing fishing grounds...", "Computing clipped boats without typhoon...")
     logger.info("Step 13: Compute clipped boats no typhoon")
     pivot_table2, average_daily_counts = compute_clipped_boats_no_typhoon(
-        clipped_gdf, boats_no_typhoons, year_selected, country, output_path
+        clipped_gdf, boats_per_date, year_selected, country, output_path
     )
 
     # Phase 4: Final Calculations (Steps 14-18)
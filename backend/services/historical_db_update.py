@@ -10,7 +10,9 @@ from typing import Any
 
 import pandas as pd
 from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
 
+from backend.repositories.storage import OrjsonStorage
 from backend.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -198,8 +200,9 @@ def update_historical_database_from_run(
         if db_dir:  # Only create directory if path has a directory component
             os.makedirs(db_dir, exist_ok=True)
 
-        # TinyDB automatically creates the file if it doesn't exist
-        db = TinyDB(db_path)
+        # TinyDB automatically creates the file if it doesn't exist. Writes are held in
+        # memory and flushed once on close instead of rewriting the file per typhoon.
+        db = TinyDB(db_path, storage=CachingMiddleware(OrjsonStorage))
         typhoons_table = db.table("typhoons")
 
         # Get all existing typhoons (returns empty list if database is new/empty)
@@ -207,20 +210,20 @@ def update_historical_database_from_run(
 
         # Delete typhoons for this year (overwrite strategy)
         # If database is new, this will just skip (no typhoons to delete)
-        deleted_count = 0
-        for typhoon in all_typhoons:
-            typhoon_year = typhoon.get("dashboard_data", {}).get("year")
-            if typhoon_year == year:
-                typhoons_table.remove(doc_ids=[typhoon.doc_id])
-                deleted_count += 1
+        stale_doc_ids = [
+            typhoon.doc_id for typhoon in all_typhoons if typhoon.get("dashboard_data", {}).get("year") == year
+        ]
+        if stale_doc_ids:
+            typhoons_table.remove(doc_ids=stale_doc_ids)
+        deleted_count = len(stale_doc_ids)
 
         if deleted_count > 0:
             logger.info(f"Deleted {deleted_count} existing typhoons for year {year}")
         else:
             logger.info(f"No existing typhoons found for year {year} (database may be new or empty)")
 
-        # Process each typhoon from CSV
-        inserted_count = 0
+        # Process each typhoon from CSV, collecting records for a single batch insert
+        typhoon_records = []
         for _index, row in df.iterrows():
             if row["Typhoon"] == "Ave Daily Boats":  # Skip the baseline row
                 continue
@@ -254,10 +257,12 @@ def update_historical_database_from_run(
                 "created_at": datetime.now().isoformat(),
             }
 
-            # Insert into database
-            typhoons_table.insert(typhoon_record)
-            inserted_count += 1
-            logger.info(f"Inserted typhoon: {typhoon_name} (Year: {dashboard_data['year']})")
+            typhoon_records.append(typhoon_record)
+            logger.info(f"Prepared typhoon: {typhoon_name} (Year: {dashboard_data['year']})")
+
+        # Insert into database
+        typhoons_table.insert_multiple(typhoon_records)
+        inserted_count = len(typhoon_records)
 
         db.close()
 
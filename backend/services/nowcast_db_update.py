@@ -11,8 +11,10 @@ from datetime import datetime
 from typing import Any
 
 import pandas as pd
-from tinydb import TinyDB
+from tinydb import Query, TinyDB
 
+from backend.repositories.nowcast_repository import typhoon_summary
+from backend.repositories.storage import OrjsonStorage
 from backend.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -304,14 +306,15 @@ def update_nowcast_database_from_run(
             os.makedirs(db_dir, exist_ok=True)
 
         # TinyDB automatically creates the file if it doesn't exist
-        db = TinyDB(db_path)
+        db = TinyDB(db_path, storage=OrjsonStorage)
         typhoons_table = db.table("typhoons")
 
-        # Get all existing typhoons for deduplication
-        all_typhoons = typhoons_table.all()
+        # Index existing typhoons by UUID for deduplication
+        existing_uuids = {typhoon.get("uuid") for typhoon in typhoons_table.all()}
 
-        added_count = 0
-        updated_count = 0
+        # Entries are collected and written in one batch each, so the file is rewritten at most twice
+        new_entries = []
+        updated_entries = []
 
         # Process each cyclone
         for cyclone_name in cyclone_names:
@@ -351,29 +354,28 @@ def update_nowcast_database_from_run(
                 "track_points": track_points,
                 "daily_data": daily_data,
                 "created_at": datetime.now().isoformat(),
+                **typhoon_summary(track_points, daily_data),
             }
 
             # Check if UUID already exists (deduplication)
-            existing_doc = None
-            for typhoon in all_typhoons:
-                if typhoon.get("uuid") == cyclone_uuid:
-                    existing_doc = typhoon
-                    break
-
-            if existing_doc:
-                # Update existing entry using TinyDB doc_id
-                typhoons_table.update(entry, doc_ids=[existing_doc.doc_id])
-                updated_count += 1
-                logger.info(f"Updated existing entry for {cyclone_name} (UUID: {cyclone_uuid})")
+            if cyclone_uuid in existing_uuids:
+                updated_entries.append(entry)
+                logger.info(f"Updating existing entry for {cyclone_name} (UUID: {cyclone_uuid})")
             else:
-                # Insert new entry
-                typhoons_table.insert(entry)
-                added_count += 1
-                logger.info(f"Added new entry for {cyclone_name} (UUID: {cyclone_uuid})")
+                new_entries.append(entry)
+                logger.info(f"Adding new entry for {cyclone_name} (UUID: {cyclone_uuid})")
 
         if progress_callback:
             progress_callback(5, "Creating visualizations and updating database...", "Saving database...")
 
+        Q = Query()
+        if updated_entries:
+            typhoons_table.update_multiple([(entry, Q.uuid == entry["uuid"]) for entry in updated_entries])
+        if new_entries:
+            typhoons_table.insert_multiple(new_entries)
+        added_count = len(new_entries)
+        updated_count = len(updated_entries)
+
         # Close database connection
         db.close()
 
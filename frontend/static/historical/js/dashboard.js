@@ -11,6 +11,7 @@ class TyphoonDashboard {
         this.fishingGroundLayers = []; // Store polygon layers for reference
         this.boatDetectionsLayer = null; // Store boat detections layer
         this.boatDetectionsVisible = true; // Toggle visibility
+        this.dashboardDataByYear = new Map(); // year -> last response, revalidated by etag
 
         this.init();
     }
@@ -491,10 +492,24 @@ class TyphoonDashboard {
         }
     }
 
+    async fetchDashboardDataByYear(year) {
+        // Send the etag of the last response so unchanged data is not resent over the bridge
+        const cached = this.dashboardDataByYear.get(year);
+        const response = await window.pywebview.api.get_dashboard_data_by_year(year, cached ? cached.etag : null);
+
+        if (response && response.unchanged && cached) {
+            return cached;
+        }
+        if (response && response.etag) {
+            this.dashboardDataByYear.set(year, response);
+        }
+        return response;
+    }
+
     async loadTyphoonsByYear(year) {
         try {
             console.log(`Loading typhoons for year ${year}...`);
-            const dashboardData = await window.pywebview.api.get_dashboard_data_by_year(year);
+            const dashboardData = await this.fetchDashboardDataByYear(year);
 
             if (dashboardData && dashboardData.typhoons) {
                 this.typhoonData = dashboardData.typhoons;
@@ -604,7 +619,26 @@ class TyphoonDashboard {
     async loadBoatDetections(year) {
         try {
             console.log(`Loading boat detections for year ${year}...`);
-            const boatGeoJSON = await window.pywebview.api.get_boat_detections_geojson(year, 5000);
+            let boatGeoJSON = null;
+
+            // Prefer fetching the GeoJSON file from the local http server to keep the payload off the bridge
+            if (window.pywebview.api.get_boat_detections_url) {
+                try {
+                    const boatFile = await window.pywebview.api.get_boat_detections_url(year, 5000);
+                    if (boatFile && boatFile.url) {
+                        const response = await fetch(boatFile.url);
+                        if (response.ok) {
+                            boatGeoJSON = await response.json();
+                        }
+                    }
+                } catch (error) {
+                    console.warn('Could not fetch boat detections file, falling back to API payload:', error);
+                }
+            }
+
+            if (!boatGeoJSON) {
+                boatGeoJSON = await window.pywebview.api.get_boat_detections_geojson(year, 5000);
+            }
 
             if (boatGeoJSON && boatGeoJSON.features) {
                 console.log(`Loaded ${boatGeoJSON.features.length} boat detection points`);
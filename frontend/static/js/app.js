@@ -900,6 +900,13 @@ class CycloneToolkitApp {
         }, 500);
     }
 
+    onStatusUpdate(status) {
+        // Pushed by the backend between polls; polling still handles completion
+        if (this.statusPollInterval && status) {
+            this.updateLoadingScreen(status);
+        }
+    }
+
     updateLoadingScreen(status) {
         // Update progress bar
         const progressFill = document.getElementById('progressFill');
@@ -1849,5 +1856,7 @@ class TrackDrawer {
 // Initialize the application when DOM is loaded
 document.addEventListener('DOMContentLoaded', () => {
     window.app = new CycloneToolkitApp();
+    // Backend notifications (notify_frontend) are dispatched to window.dashboard
+    window.dashboard = window.app;
     window.trackDrawer = new TrackDrawer();
 });
@@ -11,10 +11,8 @@ import time
 from datetime import datetime
 from typing import Any
 
-import geopandas as gpd
 import webview
 from dotenv import load_dotenv
-from shapely.geometry import Point
 
 from backend.api.historical_api import HistoricalApi
 from backend.api.nowcast_api import NowcastApi
@@ -89,8 +87,8 @@ class CleanAPI:
     def get_typhoons_by_year(self, year: int):
         return self.__api.get_typhoons_by_year(year)
 
-    def get_dashboard_data_by_year(self, year: int):
-        return self.__api.get_dashboard_data_by_year(year)
+    def get_dashboard_data_by_year(self, year: int, client_etag: str | None = None):
+        return self.__api.get_dashboard_data_by_year(year, client_etag)
 
     def run_historical_analysis(self, country: str, year: int, overwrite: bool = False):
         return self.__api.run_historical_analysis(country, year, overwrite)
@@ -139,6 +137,9 @@ class CleanAPI:
     def get_boat_detections_geojson(self, year: int, sample_size: int = 5000):
         return self.__api.get_boat_detections_geojson(year, sample_size)
 
+    def get_boat_detections_url(self, year: int, sample_size: int = 5000):
+        return self.__api.get_boat_detections_url(year, sample_size)
+
     def set_window(self, window):
         """Set window reference after window creation - called from main()."""
         self.__api.set_window(window)
@@ -447,10 +448,10 @@ class UnifiedApi:
             return self.historical_api.get_typhoons_by_year(year)
         return {}
 
-    def get_dashboard_data_by_year(self, year: int):
+    def get_dashboard_data_by_year(self, year: int, client_etag: str | None = None):
         """Get dashboard data by year (historical only)."""
         if self.current_mode == "historical":
-            return self.historical_api.get_dashboard_data_by_year(year)
+            return self.historical_api.get_dashboard_data_by_year(year, client_etag)
         return {"typhoons": {}, "fishing_grounds": []}
 
     # Historical analysis processing methods
@@ -587,6 +588,10 @@ class UnifiedApi:
             Path to saved shapefile or None if failed
         """
         try:
+            # Imported here so app startup does not pay for geopandas
+            import geopandas as gpd
+            from shapely.geometry import Point
+
             # Parse JSON
             track_data = json.loads(track_data_json)
             points = track_data.get("points", [])
@@ -733,6 +738,22 @@ class UnifiedApi:
             logger.error(f"Error getting boat detections GeoJSON: {e}")
             return None
 
+    def get_boat_detections_url(self, year: int, sample_size: int = 5000) -> dict[str, Any] | None:
+        """Write boat detection points to a served GeoJSON file and return its URL.
+
+        Args:
+            year: Year to load data for
+            sample_size: Number of points to sample (default 5000)
+
+        Returns:
+            Dictionary with 'url' and 'count' or None
+        """
+        try:
+            return self.historical_api.get_boat_detections_url(year, sample_size)
+        except Exception as e:
+            logger.error(f"Error getting boat detections URL: {e}")
+            return None
+
     def get_latest_dashboard_mode(self) -> dict[str, Any]:
         """Determine which mode has the most recent data.
 
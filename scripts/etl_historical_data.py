@@ -243,8 +243,9 @@ def create_historical_database(csv_paths: list[str], track_files_dir: str, db_pa
     # Clear existing data
     typhoons_table.truncate()
 
-    # Process each CSV file
+    # Process each CSV file, collecting records for a single batch insert
     total_typhoon_count = 0
+    typhoon_records = []
 
     for csv_path in csv_paths:
         if not os.path.exists(csv_path):
@@ -293,10 +294,11 @@ def create_historical_database(csv_paths: list[str], track_files_dir: str, db_pa
                 "created_at": datetime.now().isoformat(),
             }
 
-            # Insert with numeric key
-            typhoons_table.insert(typhoon_record)
+            typhoon_records.append(typhoon_record)
             print(f"Created typhoon record {typhoon_id}: {row['Typhoon']} (Year: {dashboard_data['year']})")
 
+    # Insert with numeric keys
+    typhoons_table.insert_multiple(typhoon_records)
     db.close()
     print(f"Historical database created with {total_typhoon_count} typhoons from {len(csv_paths)} files")
 
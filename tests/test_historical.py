@@ -0,0 +1,221 @@
+"""Tests for the historical processing pipeline helpers."""
+
+import geopandas as gpd
+import matplotlib.pyplot as plt
+import numpy as np
+import shapely
+from scipy.stats import gaussian_kde
+from shapely.geometry import Polygon, box
+
+from backend.services.historical import (
+    VIIRS_FILE_RE,
+    binned_kde,
+    clip_points,
+    merge_contour_polygons,
+    select_viirs_files,
+    viirs_season_windows,
+)
+
+# binned_kde vs gaussian_kde on the fixed point set below: the largest density difference is ~0.2% of the peak
+KDE_MAX_RELATIVE_ERROR = 0.01
+# Share of grid cells allowed to fall on different sides of the 90th percentile threshold
+KDE_DENSE_CELL_MISMATCH = 0.01
+# Symmetric difference of the dense-area polygons, relative to the reference area
+KDE_POLYGON_AREA_MISMATCH = 0.02
+
+
+def _listing(*file_names):
+    return "".join(f'<a href="{name}">{name}</a>\n' for name in file_names).encode("ascii")
+
+
+def test_viirs_file_re_parses_file_name_parts():
+    html = _listing(
+        "VBD_npp_d20240701_phl_noaa_ops_v23.csv",
+        "VBD_npp_d20240702_phl_noaa_ops_v23.csv.gz",
+        "VBD_npp_d20240703_phl_noaa_ops_v22.csv",
+        "VBD_npp_d20240704_phl_noaa_ops_v23.csv.md5",
+    )
+
+    assert VIIRS_FILE_RE.findall(html) == [
+        (b"VBD_npp_d20240701_phl_noaa_ops_v23.csv", b"2024", b"07", b"01", b"phl"),
+        (b"VBD_npp_d20240702_phl_noaa_ops_v23.csv.gz", b"2024", b"07", b"02", b"phl"),
+    ]
+
+
+def test_season_window_bounds():
+    seasons = {"phl": {"start_month": 6, "end_month": 11}}
+
+    assert viirs_season_windows(2023, "phl", seasons, today=(2025, 1, 1)) == [((2023, 6, 1), (2023, 11, 31))]
+    assert viirs_season_windows(2023, "vnm", seasons, today=(2025, 1, 1)) == []
+
+
+def test_season_window_crossing_year_and_capped_at_today():
+    seasons = {"fji": [{"start_month": 11, "end_month": 4}]}
+
+    assert viirs_season_windows(2023, "fji", seasons, today=(2025, 1, 1)) == [((2023, 11, 1), (2024, 4, 31))]
+    assert viirs_season_windows(2024, "fji", seasons, today=(2024, 12, 15)) == [((2024, 11, 1), (2024, 12, 15))]
+
+
+def test_select_viirs_files_start_and_end_are_inclusive():
+    windows = [((2023, 6, 1), (2023, 11, 31))]
+    html = _listing(
+        "VBD_npp_d20230531_phl_noaa_ops_v23.csv",
+        "VBD_npp_d20230601_phl_noaa_ops_v23.csv",
+        "VBD_npp_d20231130_phl_noaa_ops_v23.csv.gz",
+        "VBD_npp_d20231201_phl_noaa_ops_v23.csv",
+        "VBD_npp_d20230715_vnm_noaa_ops_v23.csv",
+    )
+
+    assert select_viirs_files(html, "phl", windows) == [
+        "VBD_npp_d20230601_phl_noaa_ops_v23.csv",
+        "VBD_npp_d20231130_phl_noaa_ops_v23.csv.gz",
+    ]
+
+
+def test_select_viirs_files_stops_at_today():
+    windows = viirs_season_windows(2024, "phl", {"phl": {"start_month": 6, "end_month": 11}}, today=(2024, 7, 10))
+    html = _listing(
+        "VBD_npp_d20240710_phl_noaa_ops_v23.csv",
+        "VBD_npp_d20240711_phl_noaa_ops_v23.csv",
+    )
+
+    assert select_viirs_files(html, "phl", windows) == ["VBD_npp_d20240710_phl_noaa_ops_v23.csv"]
+
+
+def _boat_clusters():
+    rng = np.random.default_rng(0)
+    centers = np.array([[121.0, 14.0], [123.5, 12.0], [120.0, 17.5]])
+    points = np.concatenate([rng.normal(center, [0.4, 0.3], size=(150, 2)) for center in centers])
+    return points[:, 0], points[:, 1]
+
+
+def _dense_area_polygons(x_grid, y_grid, density):
+    fig, ax = plt.subplots()
+    try:
+        contours = ax.contour(x_grid, y_grid, density, levels=[np.percentile(density, 90)])
+        rings = [ring for path in contours.get_paths() for ring in path.to_polygons() if len(ring) >= 3]
+    finally:
+        plt.close(fig)
+    return [Polygon(ring) for ring in rings]
+
+
+def test_binned_kde_matches_gaussian_kde():
+    x_coords, y_coords = _boat_clusters()
+
+    x_grid, y_grid, density = binned_kde(x_coords, y_coords)
+    grid = np.vstack([x_grid.ravel(), y_grid.ravel()])
+    reference = gaussian_kde(np.vstack([x_coords, y_coords]))(grid).reshape(x_grid.shape)
+
+    assert density.shape == reference.shape == (100, 100)
+    assert np.abs(density - reference).max() <= KDE_MAX_RELATIVE_ERROR * reference.max()
+
+    dense = density >= np.percentile(density, 90)
+    dense_reference = reference >= np.percentile(reference, 90)
+    assert np.count_nonzero(dense != dense_reference) <= KDE_DENSE_CELL_MISMATCH * density.size
+
+
+def test_binned_kde_dense_area_polygons_match_gaussian_kde():
+    x_coords, y_coords = _boat_clusters()
+
+    x_grid, y_grid, density = binned_kde(x_coords, y_coords)
+    grid = np.vstack([x_grid.ravel(), y_grid.ravel()])
+    reference = gaussian_kde(np.vstack([x_coords, y_coords]))(grid).reshape(x_grid.shape)
+
+    polygons = _dense_area_polygons(x_grid, y_grid, density)
+    reference_polygons = _dense_area_polygons(x_grid, y_grid, reference)
+
+    # One dense area per boat cluster
+    assert len(polygons) == len(reference_polygons) == 3
+    merged, merged_reference = shapely.union_all(polygons), shapely.union_all(reference_polygons)
+    assert merged.symmetric_difference(merged_reference).area <= KDE_POLYGON_AREA_MISMATCH * merged_reference.area
+
+
+def _pairwise_merge(polygons):
+    """The forward-only pairwise merge loop determine_fishing_grounds used before the cascaded union."""
+    merged = []
+    merged_flags = [False] * len(polygons)
+    for i, polygon in enumerate(polygons):
+        if merged_flags[i]:
+            continue
+        current = polygon
+        for j in range(i + 1, len(polygons)):
+            if not merged_flags[j] and current.intersects(polygons[j]):
+                current = current.union(polygons[j])
+                merged_flags[j] = True
+        merged.append(current)
+        merged_flags[i] = True
+    return merged
+
+
+def _assert_same_grounds(merged, expected):
+    assert len(merged) == len(expected)
+    for ground, expected_ground in zip(merged, expected, strict=True):
+        assert ground.equals(expected_ground)
+
+
+def test_merge_contour_polygons_matches_pairwise_merge():
+    polygons = [
+        box(0, 0, 2, 2),
+        box(10, 10, 12, 12),
+        box(1, 1, 3, 3),  # overlaps the first ground
+        box(20, 0, 21, 1),
+        box(10.5, 10.5, 11, 11),  # nested in the second ground
+        box(2.5, 2.5, 4, 4),  # overlaps the first ground through the third polygon
+    ]
+
+    _assert_same_grounds(merge_contour_polygons(polygons), _pairwise_merge(polygons))
+
+
+def test_merge_contour_polygons_keeps_contour_order():
+    polygons = [box(5, 5, 6, 6), box(0, 0, 1, 1), box(5.5, 5.5, 7, 7)]
+
+    merged = merge_contour_polygons(polygons)
+
+    _assert_same_grounds(merged, _pairwise_merge(polygons))
+    assert merged[0].contains(polygons[0])
+    assert merged[1].equals(polygons[1])
+
+
+def test_merge_contour_polygons_random_contours_match_pairwise_merge():
+    rng = np.random.default_rng(0)
+    checked = 0
+    for _ in range(50):
+        # Unit squares at least one unit apart, each overlapped by up to one extra polygon, so no later
+        # polygon bridges two grounds found earlier
+        corners = rng.uniform(0, 100, size=(8, 2))
+        squares = [box(x, y, x + 1, y + 1) for x, y in corners]
+        if any(a.distance(b) < 1 for i, a in enumerate(squares) for b in squares[i + 1 :]):
+            continue
+        overlays = [box(x + 0.5, y + 0.5, x + 1.2, y + 1.2) for x, y in corners[rng.permutation(8)[:3]]]
+        polygons = [squares[i] for i in rng.permutation(8)] + overlays
+
+        _assert_same_grounds(merge_contour_polygons(polygons), _pairwise_merge(polygons))
+        checked += 1
+
+    assert checked >= 10
+
+
+def test_merge_contour_polygons_joins_grounds_bridged_by_a_later_polygon():
+    left, right, bridge = box(0, 0, 2, 2), box(3, 0, 5, 2), box(1, 0.5, 4, 1.5)
+
+    merged = merge_contour_polygons([left, right, bridge])
+
+    # The pairwise loop left the right square as a separate, overlapping ground; the union joins all three
+    assert len(_pairwise_merge([left, right, bridge])) == 2
+    assert len(merged) == 1
+    assert merged[0].equals(shapely.union_all([left, right, bridge]))
+
+
+def test_clip_points_on_eez_subset_does_not_reuse_full_union():
+    eez = gpd.GeoDataFrame(
+        {"k": [0, 1, 0]}, geometry=[box(0, 0, 1, 1), box(0, 1, 1, 2), box(0, 2, 1, 3)], crs="EPSG:4326"
+    )
+    # The second point lies in the dropped middle polygon but inside the subset's bounding box
+    points = gpd.GeoDataFrame(geometry=gpd.points_from_xy([0.5, 0.5], [0.5, 1.5]), crs="EPSG:4326")
+
+    # Build the full union first so a subset that shared its cache would keep the second point
+    assert len(clip_points(points, eez)) == 2
+    subset = eez[eez.k == 0]
+
+    assert len(clip_points(points, subset)) == len(gpd.clip(points, subset)) == 1
+    assert len(clip_points(points, eez)) == 2
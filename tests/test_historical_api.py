@@ -0,0 +1,163 @@
+"""Tests for the historical API helpers."""
+
+import math
+import threading
+import time
+
+import orjson
+
+from backend.api import historical_api
+from backend.api.historical_api import _feature_collection
+
+
+def test_feature_collection_skips_non_finite_coordinates():
+    lon = [120.5, math.nan, 121.0, math.inf]
+    lat = [14.25, 15.0, math.nan, 16.0]
+    dates = ["2024-01-01", "2024-01-02", None, "2024-01-04"]
+
+    geojson = orjson.loads(orjson.dumps(_feature_collection(lon, lat, dates)))
+
+    assert geojson["type"] == "FeatureCollection"
+    assert [f["geometry"]["coordinates"] for f in geojson["features"]] == [[120.5, 14.25]]
+    assert geojson["features"][0]["properties"] == {"date": "2024-01-01"}
+
+
+def test_feature_collection_rounds_and_keeps_every_finite_point():
+    lon = [120.123456789, 121.0]
+    lat = [14.987654321, 15.0]
+    dates = ["2024-01-01", None]
+
+    geojson = orjson.loads(orjson.dumps(_feature_collection(lon, lat, dates)))
+
+    assert [f["geometry"]["coordinates"] for f in geojson["features"]] == [[120.12346, 14.98765], [121.0, 15.0]]
+    assert geojson["features"][1]["properties"] == {"date": None}
+
+
+def test_resubmit_rejected_until_cancelled_job_stops(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    class Config:
+        output_path = "unused"
+
+        @classmethod
+        def from_defaults(cls, **kwargs):
+            return cls()
+
+        def ensure_paths_exist(self):
+            pass
+
+    def main(config, progress_callback, **kwargs):
+        started.set()
+        release.wait(5)
+        progress_callback(2, "Processing", "still going")
+
+    monkeypatch.setattr(historical_api, "_historical_pipeline", lambda: (Config, main))
+    api = historical_api.HistoricalApi()
+    try:
+        assert api.run_historical_analysis("philippines", 2024)["status"] == "started"
+        assert started.wait(5)
+        assert api.cancel_historical_analysis()["status"] == "cancelled"
+
+        # The cancelled job is still inside main(), so a new run must not start yet
+        assert api.run_historical_analysis("philippines", 2024)["status"] == "error"
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while api._active_job is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert api.get_historical_analysis_status()["status"] == "cancelled"
+    finally:
+        release.set()
+        api.close()
+
+
+def test_dashboard_etag_round_trips_through_json():
+    api = historical_api.HistoricalApi()
+    try:
+        first = api.get_dashboard_data_by_year(2024)
+        assert isinstance(first["etag"], str)
+
+        # The frontend hands back whatever it received through JSON
+        client_etag = orjson.loads(orjson.dumps(first))["etag"]
+        second = api.get_dashboard_data_by_year(2024, client_etag)
+        assert second == {"unchanged": True, "etag": first["etag"]}
+
+        assert "typhoons" in api.get_dashboard_data_by_year(2024, client_etag + "0")
+    finally:
+        api.close()
+
+
+def test_boat_detections_built_once_per_csv_version(tmp_path, monkeypatch):
+    csv_dir = tmp_path / "2024" / "intermediate"
+    csv_dir.mkdir(parents=True)
+    (csv_dir / "df_all_b_phl_2024.csv").write_text(
+        "Lon_DNB,Lat_DNB,date_only,QF_Detect\n120.5,14.25,2024-07-01,1\n121.0,15.0,,2\n"
+    )
+    monkeypatch.setattr(historical_api, "HISTORICAL_OUTPUT_DIR", tmp_path)
+
+    reads = []
+    read_boat_detections = historical_api._read_boat_detections
+
+    def counting_read(*args):
+        reads.append(args)
+        return read_boat_detections(*args)
+
+    monkeypatch.setattr(historical_api, "_read_boat_detections", counting_read)
+    historical_api._boat_geojson.cache_clear()
+
+    api = historical_api.HistoricalApi()
+    try:
+        first = api.get_boat_detections_geojson(2024)
+        second = api.get_boat_detections_geojson(2024)
+    finally:
+        api.close()
+        historical_api._boat_geojson.cache_clear()
+
+    assert second is first
+    assert len(reads) == 1
+    assert [f["properties"]["date"] for f in first["features"]] == ["2024-07-01", None]
+
+
+def test_boat_detections_url_serves_file_and_skips_rewrite(tmp_path, monkeypatch):
+    csv_dir = tmp_path / "2024" / "intermediate"
+    csv_dir.mkdir(parents=True)
+    (csv_dir / "df_all_b_phl_2024.csv").write_text("Lon_DNB,Lat_DNB,date_only,QF_Detect\n120.5,14.25,2024-07-01,1\n")
+    serve_dir = tmp_path / "served"
+    monkeypatch.setattr(historical_api, "HISTORICAL_OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(historical_api, "BOAT_DETECTIONS_SERVE_DIR", serve_dir)
+    historical_api._boat_geojson.cache_clear()
+
+    api = historical_api.HistoricalApi()
+    try:
+        first = api.get_boat_detections_url(2024)
+        served = serve_dir / "boat_detections_2024.geojson"
+        written_ns = served.stat().st_mtime_ns
+        second = api.get_boat_detections_url(2024)
+    finally:
+        api.close()
+        historical_api._boat_geojson.cache_clear()
+
+    assert first == second
+    assert first["count"] == 1
+    assert first["url"].startswith("/historical/data/boat_detections/boat_detections_2024.geojson?v=")
+    assert orjson.loads(served.read_bytes())["features"][0]["geometry"]["coordinates"] == [120.5, 14.25]
+    assert served.stat().st_mtime_ns == written_ns
+
+
+def test_last_status_of_a_phase_is_pushed(monkeypatch):
+    pushed = []
+    api = historical_api.HistoricalApi()
+    monkeypatch.setattr(api, "notify_frontend", lambda event, data: pushed.append(data))
+    try:
+        for i in range(20):
+            api._update_status(2, "Processing", f"step {i}")
+
+        assert api.get_historical_analysis_status()["message"] == "step 19"
+        deadline = time.monotonic() + 5
+        while not (pushed and pushed[-1]["message"] == "step 19") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pushed[-1]["message"] == "step 19"
+        assert len(pushed) < 20
+    finally:
+        api.close()
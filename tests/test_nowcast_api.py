@@ -0,0 +1,109 @@
+"""Tests for the nowcast API."""
+
+import sys
+import threading
+import time
+import types
+
+from backend.api.nowcast_api import NowcastApi
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_cancelled_run_does_not_touch_next_run(monkeypatch):
+    calls = []
+    gates = [threading.Event(), threading.Event()]
+
+    class NowcastConfig:
+        output_path = "unused"
+        local_zip_path = None
+
+        @classmethod
+        def from_defaults(cls, **kwargs):
+            return cls()
+
+        def ensure_paths_exist(self):
+            pass
+
+    def main(progress_callback, **kwargs):
+        gate = gates[len(calls)]
+        calls.append(progress_callback)
+        gate.wait(5)
+        progress_callback(2, "Processing", "still going")
+
+    nowcast = types.ModuleType("backend.services.nowcast")
+    nowcast.NowcastConfig = NowcastConfig
+    nowcast.main = main
+    monkeypatch.setitem(sys.modules, "backend.services.nowcast", nowcast)
+
+    api = NowcastApi()
+    try:
+        assert api.run_nowcast_analysis("philippines")["status"] == "started"
+        assert _wait_for(lambda: len(calls) == 1)
+        assert api.cancel_nowcast_analysis()["status"] == "cancelled"
+        assert _wait_for(lambda: not api._processing_thread.is_alive())
+
+        # The first pipeline is still blocked in main(); start a second run regardless
+        assert api.run_nowcast_analysis("philippines")["status"] == "started"
+        gates[0].set()
+
+        # The abandoned run stops at its next callback on its own token and
+        # cannot overwrite the new run's status
+        assert _wait_for(lambda: len(calls) == 2)
+        status = api.get_nowcast_analysis_status()
+        assert status["status"] == "running"
+        assert status["message"] == "Starting nowcast analysis..."
+    finally:
+        api.cancel_nowcast_analysis()
+        for gate in gates:
+            gate.set()
+        api.close()
+
+
+def test_run_cancelled_while_queued_never_starts(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    class NowcastConfig:
+        output_path = "unused"
+        local_zip_path = None
+
+        @classmethod
+        def from_defaults(cls, **kwargs):
+            return cls()
+
+        def ensure_paths_exist(self):
+            pass
+
+    def main(progress_callback, **kwargs):
+        calls.append(progress_callback)
+        release.wait(5)
+
+    nowcast = types.ModuleType("backend.services.nowcast")
+    nowcast.NowcastConfig = NowcastConfig
+    nowcast.main = main
+    monkeypatch.setitem(sys.modules, "backend.services.nowcast", nowcast)
+
+    api = NowcastApi()
+    try:
+        assert api.run_nowcast_analysis("philippines")["status"] == "started"
+        assert _wait_for(lambda: len(calls) == 1)
+        api.cancel_nowcast_analysis()
+        assert _wait_for(lambda: not api._processing_thread.is_alive())
+
+        # The second run queues behind the first pipeline's lock and is cancelled there
+        assert api.run_nowcast_analysis("philippines")["status"] == "started"
+        api.cancel_nowcast_analysis()
+        assert _wait_for(lambda: not api._processing_thread.is_alive())
+
+        release.set()
+        time.sleep(0.2)
+        assert len(calls) == 1
+    finally:
+        release.set()
+        api.close()
@@ -0,0 +1,59 @@
+"""Tests for the nowcast repository."""
+
+import math
+
+import pandas as pd
+
+from backend.repositories.nowcast_repository import (
+    BASELINE_COLUMNS,
+    DISTANCE_COLUMNS,
+    PREDICTED_COLUMNS,
+    NowcastRepository,
+    activity_difference_label,
+    nullable_ints,
+)
+
+
+def test_activity_difference_label_zero_baseline():
+    assert activity_difference_label(0.0, 0.0, math.nan) == "+0%"
+    assert activity_difference_label(0.0, 5.0, math.inf) == "+∞%"
+
+
+def test_activity_difference_label_non_finite():
+    assert activity_difference_label(math.nan, 5.0, math.nan) == "N/A"
+    assert activity_difference_label(0.0, math.nan, math.nan) == "N/A"
+    assert activity_difference_label(math.inf, math.inf, math.nan) == "N/A"
+    assert activity_difference_label(1e-320, 5.0, math.inf) == "+∞%"
+    assert activity_difference_label(-1e-320, 5.0, -math.inf) == "-∞%"
+
+
+def test_activity_difference_label_finite():
+    assert activity_difference_label(8.0, 10.0, 25.0) == "+25.00%"
+    assert activity_difference_label(10.0, 8.0, -20.0) == "-20.00%"
+
+
+def test_process_csv_data_activity_difference(tmp_path):
+    row = {
+        "date_only": "2024-07-01",
+        "stm_spd_mean": 12.0,
+        "stm_spd_max": 15,
+        "USA_WIND": 80,
+        **dict(zip(DISTANCE_COLUMNS, [10.0, 20.0, 30.0, 40.0], strict=True)),
+        **dict(zip(BASELINE_COLUMNS, [0.0, 0.0, None, 8.0], strict=True)),
+        **dict(zip(PREDICTED_COLUMNS, [0.0, 5.0, 3.0, 10.0], strict=True)),
+    }
+    csv_path = tmp_path / "daily.csv"
+    pd.DataFrame([row]).to_csv(csv_path, index=False)
+
+    repo = NowcastRepository(db_path=str(tmp_path / "nowcast.json"))
+    try:
+        daily = repo.process_csv_data(str(csv_path))
+    finally:
+        repo.close()
+
+    assert daily["2024-07-01"]["activityDifference"] == ["+0%", "+∞%", "N/A", "+25.00%"]
+
+
+def test_nullable_ints_maps_missing_to_none():
+    values = pd.Series([80.0, None, 35.7, "n/a"])
+    assert nullable_ints(values) == [80, None, 35, None]
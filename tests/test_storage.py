@@ -0,0 +1,26 @@
+"""Tests for the TinyDB storage backends."""
+
+import math
+
+import numpy as np
+from tinydb import TinyDB
+
+from backend.repositories.storage import OrjsonStorage
+
+
+def test_non_finite_floats_are_stored_as_null(tmp_path):
+    path = tmp_path / "db.json"
+    with TinyDB(path, storage=OrjsonStorage) as db:
+        db.insert({"nan": math.nan, "inf": np.float32("inf"), "values": np.array([-np.inf, 1.5])})
+
+    assert b"NaN" not in path.read_bytes() and b"Infinity" not in path.read_bytes()
+    with TinyDB(path, storage=OrjsonStorage) as db:
+        assert db.all() == [{"nan": None, "inf": None, "values": [None, 1.5]}]
+
+
+def test_reads_stdlib_non_finite_literals(tmp_path):
+    path = tmp_path / "db.json"
+    path.write_text('{"_default": {"1": {"value": NaN}}}')
+
+    with TinyDB(path, storage=OrjsonStorage) as db:
+        assert math.isnan(db.all()[0]["value"])